@@ -7,6 +7,7 @@ Performs comprehensive validation of text content, verse sequences, and structur
 
 Requirements:
 - pip install colorama
+- pip install orjson (optional, faster JSON parsing)
 
 Usage:
     python3 bible_anomaly_detector.py [--config config.json] [--dir path/to/json/files]
@@ -19,7 +20,7 @@ import sys
 import logging
 import argparse
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Dict, List, Set, FrozenSet, Tuple, Optional, Any
 from dataclasses import dataclass
 from collections import defaultdict, Counter
 import unicodedata
@@ -38,6 +39,27 @@ except ImportError:
     class Style:
         DIM = NORMAL = BRIGHT = RESET_ALL = ""
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps_indented(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+# Write buffer for report/log files (fewer flushes on large reports)
+REPORT_BUFFER_SIZE = 1 << 20
+
 # Expected 66 books in correct order
 EXPECTED_BOOKS = [
     'Gen', 'Exo', 'Lev', 'Num', 'Deu', 'Jos', 'Jdg', 'Rut', '1Sa', '2Sa',
@@ -86,11 +108,20 @@ class Config:
     min_verse_length: int = 3
     max_verse_length: int = 500
     allowed_chars_pattern: str = r'^[a-zA-Z0-9\s\.,;:!?\'"()\[\]\/\-–—""''…]*$'
-    skip_books: Set[str] = None
+    skip_books: FrozenSet[str] = frozenset()
     
     def __post_init__(self):
-        if self.skip_books is None:
-            self.skip_books = set()
+        # Normalize once so per-book lookups are a plain frozenset hit
+        self.skip_books = frozenset(book.upper() for book in self.skip_books or ())
+
+@dataclass
+class SummaryStats:
+    """Totals computed while writing the summary report"""
+    total_files: int
+    clean_count: int  # files with no anomalies at all, of any severity
+    problematic_count: int  # files with at least one anomaly
+    total_anomalies: int
+    top_issues: List[Tuple[str, int]]
 
 class BibleAnomalyDetector:
     """Main anomaly detection class"""
@@ -106,6 +137,10 @@ class BibleAnomalyDetector:
         self.processed_files = []
         self.verse_hashes = defaultdict(list)  # For duplicate detection
         
+        # Only emit ANSI colors on an interactive terminal (honors NO_COLOR)
+        self._use_color = (COLORAMA_AVAILABLE and sys.stdout.isatty()
+                           and os.environ.get('NO_COLOR') is None)
+        
         # Setup logging
         self.setup_logging()
     
@@ -138,6 +173,9 @@ class BibleAnomalyDetector:
     
     def print_status(self, message: str, color: str = 'white'):
         """Print colored status message"""
+        if not self._use_color:
+            print(message)
+            return
         print(self.colorize(message, color))
     
     def detect_text_anomalies(self, text: str, location: str) -> List[Anomaly]:
@@ -436,7 +474,7 @@ class BibleAnomalyDetector:
         
         # Check each book structure
         for book_abbrev, book_data in books.items():
-            if book_abbrev in self.config.skip_books:
+            if book_abbrev.upper() in self.config.skip_books:
                 continue
             
             # Check book structure
@@ -514,7 +552,7 @@ class BibleAnomalyDetector:
         
         books = bible_data.get('books', {})
         for book_abbrev, book_data in books.items():
-            if book_abbrev in self.config.skip_books:
+            if book_abbrev.upper() in self.config.skip_books:
                 continue
                 
             chapters = book_data.get('chapters', {})
@@ -577,7 +615,7 @@ class BibleAnomalyDetector:
         # Text and sequence validation
         books = bible_data.get('books', {})
         for book_abbrev, book_data in books.items():
-            if book_abbrev in self.config.skip_books:
+            if book_abbrev.upper() in self.config.skip_books:
                 continue
             
             chapters = book_data.get('chapters', {})
@@ -612,7 +650,8 @@ class BibleAnomalyDetector:
         """Write detailed log file for a translation"""
         log_file = self.log_dir / f"{translation_abbrev}_anomalies.log"
         
-        with open(log_file, 'w', encoding='utf-8') as f:
+        with open(log_file, 'w', encoding='utf-8', newline='',
+                  buffering=REPORT_BUFFER_SIZE) as f:
             f.write(f"ANOMALY DETECTION REPORT FOR {translation_abbrev}\n")
             f.write(f"Source file: {filename}\n")
             f.write(f"Analysis complete\n")
@@ -693,15 +732,18 @@ class BibleAnomalyDetector:
         
         return all_results
     
-    def generate_summary_report(self, all_results: Dict):
+    def generate_summary_report(self, all_results: Dict) -> SummaryStats:
         """Generate comprehensive summary report"""
         summary_file = self.log_dir / "anomaly_summary.txt"
+        total_anomalies = sum(len(r['anomalies']) for r in all_results.values())
+        anomaly_free_count = sum(1 for r in all_results.values() if not r['anomalies'])
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
+        with open(summary_file, 'w', encoding='utf-8', newline='',
+                  buffering=REPORT_BUFFER_SIZE) as f:
             f.write("BIBLE JSON ANOMALY DETECTION SUMMARY REPORT\n")
             f.write("=" * 60 + "\n\n")
             f.write(f"Files processed: {len(all_results)}\n")
-            f.write(f"Total anomalies found: {sum(len(r['anomalies']) for r in all_results.values())}\n\n")
+            f.write(f"Total anomalies found: {total_anomalies}\n\n")
             
             # Global statistics
             f.write("GLOBAL STATISTICS BY SEVERITY:\n")
@@ -725,9 +767,11 @@ class BibleAnomalyDetector:
             problematic_files = []
             
             for abbrev, result in sorted(all_results.items()):
-                anomalies = result['anomalies']
-                errors = len([a for a in anomalies if a.severity == "ERROR"])
-                warnings = len([a for a in anomalies if a.severity == "WARNING"])
+                # Counted from the anomalies: files that failed to load
+                # return their single ERROR with empty stats
+                severities = Counter(anomaly.severity for anomaly in result['anomalies'])
+                errors = severities["ERROR"]
+                warnings = severities["WARNING"]
                 
                 if errors == 0 and warnings == 0:
                     clean_files.append(abbrev)
@@ -749,11 +793,20 @@ class BibleAnomalyDetector:
                 for anomaly in result['anomalies']:
                     issue_counter[f"{anomaly.severity}_{anomaly.category}_{anomaly.description}"] += 1
             
-            for issue, count in issue_counter.most_common(10):
+            top_issues = issue_counter.most_common(10)
+            for issue, count in top_issues:
                 f.write(f"{count:>3}x {issue}\n")
         
         self.print_status(f"\n📊 Summary report written to: {summary_file}", 'blue')
         self.print_status(f"📝 Individual logs written to: {self.log_dir}/*_anomalies.log", 'blue')
+        
+        return SummaryStats(
+            total_files=len(all_results),
+            clean_count=anomaly_free_count,
+            problematic_count=len(all_results) - anomaly_free_count,
+            total_anomalies=total_anomalies,
+            top_issues=top_issues
+        )
 
 def load_config(config_path: Path) -> Config:
     """Load configuration from JSON file"""
@@ -761,8 +814,7 @@ def load_config(config_path: Path) -> Config:
         return Config()
     
     try:
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
+        config_data = json_loads(config_path.read_bytes())
         
         return Config(
             check_text_content=config_data.get('check_text_content', True),
@@ -772,7 +824,7 @@ def load_config(config_path: Path) -> Config:
             min_verse_length=config_data.get('min_verse_length', 3),
             max_verse_length=config_data.get('max_verse_length', 500),
             allowed_chars_pattern=config_data.get('allowed_chars_pattern', r'^[a-zA-Z0-9\s\.,;:!?\'"()\[\]\/\-–—""''…]*$'),
-            skip_books=set(config_data.get('skip_books', []))
+            skip_books=frozenset(config_data.get('skip_books', []))
         )
     except Exception as e:
         print(f"Warning: Could not load config file {config_path}: {e}")
@@ -791,8 +843,7 @@ def create_sample_config(config_path: Path):
         "skip_books": []
     }
     
-    with open(config_path, 'w') as f:
-        json.dump(sample_config, f, indent=2)
+    config_path.write_bytes(json_dumps_indented(sample_config))
     
     print(f"Sample config created at: {config_path}")
 
@@ -831,19 +882,15 @@ def main():
     all_results = detector.process_directory(args.dir)
     
     if all_results:
-        detector.generate_summary_report(all_results)
+        summary = detector.generate_summary_report(all_results)
         
         # Final summary
-        total_files = len(all_results)
-        clean_files = len([r for r in all_results.values() if not r['anomalies']])
-        total_anomalies = sum(len(r['anomalies']) for r in all_results.values())
-        
         print("\n" + "=" * 50)
         detector.print_status(f"📈 FINAL SUMMARY:", 'blue')
-        detector.print_status(f"   Files processed: {total_files}", 'white')
-        detector.print_status(f"   Clean files: {clean_files}", 'green' if clean_files > 0 else 'white')
-        detector.print_status(f"   Files with issues: {total_files - clean_files}", 'yellow' if total_files - clean_files > 0 else 'white')
-        detector.print_status(f"   Total anomalies: {total_anomalies}", 'red' if total_anomalies > 0 else 'green')
+        detector.print_status(f"   Files processed: {summary.total_files}", 'white')
+        detector.print_status(f"   Clean files: {summary.clean_count}", 'green' if summary.clean_count > 0 else 'white')
+        detector.print_status(f"   Files with issues: {summary.problematic_count}", 'yellow' if summary.problematic_count > 0 else 'white')
+        detector.print_status(f"   Total anomalies: {summary.total_anomalies}", 'red' if summary.total_anomalies > 0 else 'green')
         print("=" * 50)
 
 if __name__ == "__main__":
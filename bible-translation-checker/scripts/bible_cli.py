@@ -15,8 +15,6 @@ Usage:
 import sys
 import argparse
 from pathlib import Path
-from bible_correction_system import BibleDatabaseManager, ErrorDetectionEngine
-import json
 
 def import_json_file(db_manager, file_path, translation=None):
     """Import a JSON Bible file"""
@@ -33,6 +31,7 @@ def import_json_file(db_manager, file_path, translation=None):
                 print(f"  {count} {description}")
         
         result = db_manager.import_json_file(path, translation, progress_callback)
+        db_manager.optimize()
         
         print(f"✅ Import successful:")
         print(f"   Translation: {result['translation']}")
@@ -45,10 +44,12 @@ def import_json_file(db_manager, file_path, translation=None):
         print(f"❌ Import failed: {e}")
         return False
 
-def scan_translation(db_manager, translation):
+def scan_translation(db_manager, translation, near_duplicates=False):
     """Scan a translation for errors"""
     try:
-        engine = ErrorDetectionEngine(db_manager)
+        from bible_correction_system import ErrorDetectionEngine
+        
+        engine = ErrorDetectionEngine(db_manager, near_duplicates)
         
         print(f"Scanning {translation} for errors...")
         
@@ -58,6 +59,7 @@ def scan_translation(db_manager, translation):
                 print(f"  Progress: {progress:.1f}% - {description}")
         
         result = engine.scan_translation(translation, progress_callback)
+        db_manager.optimize()
         
         print(f"✅ Scan complete:")
         print(f"   Total verses: {result['total_verses']}")
@@ -113,12 +115,12 @@ def show_statistics(db_manager):
 def export_translation(db_manager, translation, output_file, use_corrected=True):
     """Export a translation to JSON"""
     try:
+        from bible_correction_system import write_json_file
+        
         print(f"Exporting {translation}...")
         
         data = db_manager.export_translation(translation, use_corrected)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json_file(output_file, data)
         
         verses_exported = sum(
             len(book['chapters'][ch]) 
@@ -170,8 +172,7 @@ def show_errors(db_manager, translation=None, error_type=None, limit=20):
     try:
         error_type_id = None
         if error_type:
-            error_types = db_manager.get_error_types()
-            error_type_obj = next((et for et in error_types if et['error_code'] == error_type), None)
+            error_type_obj = db_manager.get_error_types_by_code().get(error_type)
             if error_type_obj:
                 error_type_id = error_type_obj['id']
             else:
@@ -235,6 +236,8 @@ Examples:
     # Scan command
     scan_parser = subparsers.add_parser('scan', help='Scan translation for errors')
     scan_parser.add_argument('translation', help='Translation abbreviation to scan')
+    scan_parser.add_argument('--near-duplicates', action='store_true',
+                            help='Also report nearly identical verses (needs datasketch)')
     
     # Statistics command
     subparsers.add_parser('stats', help='Show database statistics')
@@ -261,6 +264,10 @@ Examples:
         parser.print_help()
         return 1
     
+    # Import the database layer only once a command actually needs it
+    # (keeps --help and argument errors fast)
+    from bible_correction_system import BibleDatabaseManager
+    
     # Initialize database
     try:
         db_manager = BibleDatabaseManager(args.db)
@@ -275,7 +282,7 @@ Examples:
             success = import_json_file(db_manager, args.file, args.translation)
         
         elif args.command == 'scan':
-            success = scan_translation(db_manager, args.translation)
+            success = scan_translation(db_manager, args.translation, args.near_duplicates)
         
         elif args.command == 'stats':
             success = show_statistics(db_manager)
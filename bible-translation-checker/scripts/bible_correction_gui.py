@@ -12,14 +12,72 @@ Comprehensive GUI interface for Bible text correction system with:
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext, simpledialog
+import os
+import multiprocessing
 import threading
-import json
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from collections import OrderedDict
+from itertools import takewhile
 import csv
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 import webbrowser
 
+# Delay used to coalesce rapid combobox/search events
+DEBOUNCE_MS = 150
+
+# Minimum seconds between forced status bar repaints
+STATUS_REFRESH_INTERVAL = 0.05
+
+# Verse status labels indexed by has_errors + 2 * edited
+VERSE_STATUS = ("✅ Clean", "❌ Error", "✏️ Edited", "✏️ Edited")
+
+# Row colours for error severities; other severities use the default
+SEVERITY_COLORS = {'CRITICAL': 'red', 'WARNING': 'orange'}
+
+# Characters of verse text shown in the verse list
+PREVIEW_LENGTH = 50
+
+# Error instances fetched per query when loading the errors list
+ERROR_PAGE_SIZE = 1000
+
+# Chapters whose verse lists are kept for quick switching back
+VERSE_CACHE_SIZE = 16
+
+def format_verse_rows(verses: List) -> List[tuple]:
+    """Build (iid, (reference, preview, status)) verse tree rows"""
+    limit = PREVIEW_LENGTH
+    status = VERSE_STATUS
+    return [
+        (str(verse.id), (
+            f"{verse.book} {verse.chapter}:{verse.verse}",
+            verse.original_text[:limit] + "..." if len(verse.original_text) > limit else verse.original_text,
+            status[verse.has_errors + 2 * bool(verse.corrected_text)]
+        ))
+        for verse in verses
+    ]
+
+def error_page_cursor(errors: List[Dict]) -> Optional[tuple]:
+    """(detected_date, id) of a page's last error, to fetch the page after it"""
+    return (errors[-1]['detected_date'], errors[-1]['id']) if errors else None
+
+def format_error_rows(errors: List[Dict]) -> List[tuple]:
+    """Build (iid, values) errors tree rows"""
+    return [
+        (str(error['id']), (
+            error['id'],
+            error['translation'],
+            f"{error['book']} {error['chapter']}:{error['verse']}",
+            error['error_code'],
+            error['severity'],
+            error['status'],
+            error['error_text_short']
+        ))
+        for error in errors
+    ]
+
 class BibleCorrectionGUI:
     """Main GUI application for Bible correction system"""
     
@@ -39,10 +97,40 @@ class BibleCorrectionGUI:
         self.current_translation = tk.StringVar()
         self.current_book = tk.StringVar()
         self.current_chapter = tk.StringVar()
+        self._book_abbrevs = {}  # book combo display string -> book abbreviation
+        self.current_book_abbrev = None  # parsed from current_book on write
+        self.current_chapter_num = None  # parsed from current_chapter on write
+        self.current_book.trace_add('write', self._on_book_var_write)
+        self.current_chapter.trace_add('write', self._on_chapter_var_write)
         self.selected_verse_id = None
+        self._verses_by_id = {}  # verses of the chapter currently listed
         self.search_var = tk.StringVar()
         self.filter_error_type = tk.StringVar(value="All")
         self.filter_status = tk.StringVar(value="open")
+        self._pending_after = {}  # debounce key -> after() id
+        self._verse_request = None  # (translation, book, chapter) being listed
+        self._combo_values = {}  # combobox -> values tuple last assigned
+        self._stats_ids = []  # iids of the rows currently in stats_tree
+        self._error_filters = None  # (status, error_type_id) of the listed errors; None until first listed
+        self._errors_cursor = None  # error_page_cursor of the last page fetched
+        self._errors_exhausted = False  # the last page fetched was the final one
+        self._error_page_pending = False  # a page request is on the database worker
+        self._errors_generation = 0  # bumped per reload so stale pages are dropped
+        self._navigation_cache = {}  # ('books', translation) / ('chapters', translation, book) -> rows
+        self._verse_cache = OrderedDict()  # (translation, book, chapter) -> (verses, rows), LRU order
+        self._last_status_refresh = 0.0
+        self._progress_shown = False
+        self._pending_lock = threading.Lock()
+        self._pending_status = None  # latest status posted from a worker thread
+        self._pending_progress = None  # latest progress posted from a worker thread
+        
+        # Single worker so GUI queries run one at a time, in submission order
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gui-db')
+        
+        # Long jobs (file parsing, error scans) run here so the database
+        # worker stays free for the short reads behind the GUI; a scan uses
+        # this thread's own connection, which WAL lets write while they read
+        self._task_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gui-task')
         
         # Create GUI components
         self.create_menu()
@@ -131,22 +219,33 @@ class BibleCorrectionGUI:
         stats_frame = ttk.LabelFrame(dashboard_frame, text="Error Type Statistics")
         stats_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        # Create scrollable frame for error buttons
-        canvas = tk.Canvas(stats_frame)
-        scrollbar = ttk.Scrollbar(stats_frame, orient="vertical", command=canvas.yview)
-        self.stats_scrollable_frame = ttk.Frame(canvas)
+        # One row per error type; double-click opens the matching errors
+        self.stats_tree = ttk.Treeview(stats_frame,
+                                       columns=('Code', 'Total', 'Open', 'Fixed', 'Severity', 'Description'),
+                                       show='headings')
         
-        self.stats_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.stats_tree.heading('Code', text='Error Type', anchor='w')
+        self.stats_tree.column('Code', width=160, minwidth=120)
+        for column in ('Total', 'Open', 'Fixed'):
+            self.stats_tree.heading(column, text=column, anchor='center')
+            self.stats_tree.column(column, width=70, minwidth=50, anchor='center')
+        self.stats_tree.heading('Severity', text='Severity', anchor='center')
+        self.stats_tree.column('Severity', width=90, minwidth=70, anchor='center')
+        self.stats_tree.heading('Description', text='Description', anchor='w')
+        self.stats_tree.column('Description', width=400, minwidth=200)
+        
+        for severity, color in SEVERITY_COLORS.items():
+            self.stats_tree.tag_configure(severity, foreground=color)
         
-        canvas.create_window((0, 0), window=self.stats_scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(stats_frame, orient="vertical", command=self.stats_tree.yview)
+        self.stats_tree.configure(yscrollcommand=scrollbar.set)
         
-        canvas.pack(side="left", fill="both", expand=True)
+        self.stats_tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        self.stats_tree.bind('<Double-1>', self.on_stats_double_click)
+        self.stats_tooltip = TreeTooltip(self.stats_tree)
+        
         # Summary frame
         summary_frame = ttk.LabelFrame(dashboard_frame, text="Summary")
         summary_frame.pack(fill='x', padx=10, pady=5)
@@ -195,9 +294,12 @@ class BibleCorrectionGUI:
         
         # Search
         ttk.Label(controls_frame, text="Search:").pack(side='left', padx=(20, 5))
-        search_entry = ttk.Entry(controls_frame, textvariable=self.search_var, width=20)
-        search_entry.pack(side='left', padx=(0, 5))
-        search_btn = ttk.Button(controls_frame, text="🔍", command=self.search_verses)
+        self.search_entry = ttk.Entry(controls_frame, textvariable=self.search_var, width=20)
+        self.search_entry.pack(side='left', padx=(0, 5))
+        # Held-down Enter auto-repeats; the debounce runs one search for the burst
+        self.search_entry.bind('<Return>', lambda e: self._debounce('search', self.search_verses))
+        search_btn = ttk.Button(controls_frame, text="🔍",
+                                command=lambda: self._debounce('search', self.search_verses))
         search_btn.pack(side='left')
         
         # Main editor area
@@ -232,6 +334,7 @@ class BibleCorrectionGUI:
                                       command=self.verse_tree.xview)
         self.verse_tree.configure(yscrollcommand=verse_v_scroll.set, 
                                  xscrollcommand=verse_h_scroll.set)
+        self.verse_rows = TreeRowLoader(self.verse_tree, verse_v_scroll)
         
         self.verse_tree.pack(side='left', fill='both', expand=True)
         verse_v_scroll.pack(side='right', fill='y')
@@ -299,14 +402,14 @@ class BibleCorrectionGUI:
                                    values=['open', 'fixed', 'ignored', 'all'], 
                                    state='readonly', width=10)
         status_combo.pack(side='left', padx=(0, 20))
-        status_combo.bind('<<ComboboxSelected>>', self.refresh_errors_list)
+        status_combo.bind('<<ComboboxSelected>>', self.on_error_filter_changed)
         
         # Error type filter
         ttk.Label(filter_row, text="Error Type:").pack(side='left', padx=(0, 5))
         self.error_type_combo = ttk.Combobox(filter_row, textvariable=self.filter_error_type,
                                            state='readonly', width=20)
         self.error_type_combo.pack(side='left', padx=(0, 20))
-        self.error_type_combo.bind('<<ComboboxSelected>>', self.refresh_errors_list)
+        self.error_type_combo.bind('<<ComboboxSelected>>', self.on_error_filter_changed)
         
         # Refresh button
         ttk.Button(filter_row, text="🔄 Refresh", 
@@ -342,12 +445,20 @@ class BibleCorrectionGUI:
                                        command=self.errors_tree.xview)
         self.errors_tree.configure(yscrollcommand=errors_v_scroll.set, 
                                   xscrollcommand=errors_h_scroll.set)
+        self.errors_rows = TreeRowLoader(self.errors_tree, errors_v_scroll,
+                                         fetch_more=self._load_more_errors)
         
         self.errors_tree.pack(side='left', fill='both', expand=True)
         errors_v_scroll.pack(side='right', fill='y')
         errors_h_scroll.pack(side='bottom', fill='x')
         
-        # Context menu for errors
+        # Context menu for errors, built once and posted on each right-click
+        self.error_context_menu = tk.Menu(self.root, tearoff=0)
+        self.error_context_menu.add_command(label="Mark as Fixed", command=self.mark_error_fixed)
+        self.error_context_menu.add_command(label="Mark as Ignored", command=self.mark_error_ignored)
+        self.error_context_menu.add_command(label="Reopen Error", command=self.reopen_error)
+        self.error_context_menu.add_separator()
+        self.error_context_menu.add_command(label="View Details", command=self.view_error_details)
         self.errors_tree.bind('<Button-3>', self.show_error_context_menu)
         self.errors_tree.bind('<Double-1>', self.view_error_details)
         
@@ -405,6 +516,7 @@ class BibleCorrectionGUI:
                                       command=self.trans_tree.xview)
         self.trans_tree.configure(yscrollcommand=trans_v_scroll.set, 
                                  xscrollcommand=trans_h_scroll.set)
+        self.trans_rows = TreeRowLoader(self.trans_tree, trans_v_scroll)
         
         self.trans_tree.pack(side='left', fill='both', expand=True)
         trans_v_scroll.pack(side='right', fill='y')
@@ -436,31 +548,127 @@ class BibleCorrectionGUI:
         self.root.bind('<Control-f>', lambda e: self.search_entry.focus())
     
     # Event handlers and utility methods
+    def _debounce(self, key: str, callback, delay_ms: int = DEBOUNCE_MS):
+        """Run callback after delay_ms, replacing any call still pending for key"""
+        pending = self._pending_after.pop(key, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        
+        def run():
+            self._pending_after.pop(key, None)
+            callback()
+        
+        self._pending_after[key] = self.root.after(delay_ms, run)
+    
+    def set_combo_values(self, combo: ttk.Combobox, values):
+        """Assign combobox values, skipping the Tk update when they are unchanged"""
+        values = tuple(values)
+        if self._combo_values.get(combo) != values:
+            combo['values'] = values
+            self._combo_values[combo] = values
+    
+    def run_db_query(self, query, callback, *args, on_error=None, **kwargs):
+        """Run query(*args, **kwargs) off the Tk thread and hand the result to callback
+        
+        If the query raises, on_error receives the exception on the Tk thread;
+        without it the error is shown in the status bar.
+        """
+        future = self._db_executor.submit(query, *args, **kwargs)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._deliver_query_result, f, callback, on_error)
+        )
+    
+    def run_cached_db_query(self, key: tuple, query, callback, *args):
+        """Like run_db_query, but reuse the result stored under key in the navigation cache"""
+        if key in self._navigation_cache:
+            callback(self._navigation_cache[key])
+            return
+        
+        def store(result):
+            self._navigation_cache[key] = result
+            callback(result)
+        
+        self.run_db_query(query, store, *args)
+    
+    def clear_caches(self):
+        """Forget cached navigation and verse lists after the underlying data changed"""
+        self._navigation_cache.clear()
+        self._verse_cache.clear()
+    
+    def _deliver_query_result(self, future, callback, on_error=None):
+        """Pass a finished query result to its callback on the Tk thread"""
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            else:
+                self.set_status(f"Database error: {e}")
+            return
+        callback(result)
+    
     def set_status(self, message: str):
-        """Update status bar message"""
+        """Update status bar message; may be called from worker threads"""
+        if threading.current_thread() is not threading.main_thread():
+            # Keep only the latest message and post a single flush to Tk
+            with self._pending_lock:
+                flush_posted = self._pending_status is not None
+                self._pending_status = message
+            if not flush_posted:
+                self.root.after(0, self._flush_pending_status)
+            return
+        
         self.status_label.config(text=message)
-        self.root.update_idletasks()
+        
+        # Repaint while a long task holds the Tk thread, but at most every
+        # STATUS_REFRESH_INTERVAL seconds
+        now = time.monotonic()
+        if now - self._last_status_refresh >= STATUS_REFRESH_INTERVAL:
+            self._last_status_refresh = now
+            self.root.update_idletasks()
+    
+    def _flush_pending_status(self):
+        """Show the latest status message posted from a worker thread"""
+        with self._pending_lock:
+            message, self._pending_status = self._pending_status, None
+        self.set_status(message)
+    
+    def set_progress(self, value: float):
+        """Update the progress bar; may be called from worker threads"""
+        with self._pending_lock:
+            flush_posted = self._pending_progress is not None
+            self._pending_progress = value
+        if not flush_posted:
+            self.root.after(0, self._flush_pending_progress)
+    
+    def _flush_pending_progress(self):
+        """Show the latest progress value posted by set_progress"""
+        with self._pending_lock:
+            value, self._pending_progress = self._pending_progress, None
+        self.progress_var.set(value)
     
     def show_progress(self, show: bool = True):
         """Show or hide progress bar"""
+        if show == self._progress_shown:
+            return
+        self._progress_shown = show
         if show:
             self.progress_bar.pack(side='right', padx=5, pady=2)
         else:
             self.progress_bar.pack_forget()
-        self.root.update_idletasks()
     
     def refresh_translations(self):
         """Refresh translations list and combo boxes"""
-        translations = self.db.get_translations()
-        
+        self.run_db_query(self.db.get_translations, self._populate_translations)
+    
+    def _populate_translations(self, translations: List[Dict]):
+        """Fill the translation combo and translations tree"""
         # Update translation combo
-        trans_values = [t['abbrev'] for t in translations]
-        self.translation_combo['values'] = trans_values
+        self.set_combo_values(self.translation_combo, (t['abbrev'] for t in translations))
         
         # Update translations tree
-        self.trans_tree.delete(*self.trans_tree.get_children())
-        for trans in translations:
-            self.trans_tree.insert('', 'end', values=(
+        self.trans_rows.set_rows([
+            (trans['abbrev'], (
                 trans['abbrev'],
                 trans['full_name'],
                 trans.get('source_file', ''),
@@ -468,66 +676,52 @@ class BibleCorrectionGUI:
                 trans.get('error_count', 0),
                 trans.get('imported_date', '')[:19] if trans.get('imported_date') else ''
             ))
+            for trans in translations
+        ])
     
     def refresh_error_statistics(self):
         """Refresh error statistics dashboard"""
-        stats = self.db.get_error_statistics()
-        
-        # Clear existing buttons
-        for widget in self.stats_scrollable_frame.winfo_children():
-            widget.destroy()
+        self.run_db_query(self.db.get_error_statistics, self._populate_error_statistics)
+    
+    def _populate_error_statistics(self, stats: List[Dict]):
+        """Rebuild the dashboard from error statistics"""
+        # Clear existing rows; the iids are tracked so Tk is not asked to list them
+        if self._stats_ids:
+            self.stats_tree.delete(*self._stats_ids)
+            self._stats_ids.clear()
+        self.stats_tooltip.texts.clear()
+        
+        # Statistics arrive ordered by total_count descending, so the error
+        # types that occurred are a prefix of the list
+        stats = list(takewhile(lambda stat: stat['total_count'] > 0, stats))
         
         # Update error type combo
-        error_types = ['All'] + [stat['error_code'] for stat in stats if stat['total_count'] > 0]
-        self.error_type_combo['values'] = error_types
+        error_types = ['All'] + [stat['error_code'] for stat in stats]
+        self.set_combo_values(self.error_type_combo, error_types)
         
-        # Create error buttons
-        row = 0
-        col = 0
+        # Add a row per error type
         total_errors = 0
         total_open = 0
         total_fixed = 0
         
         for stat in stats:
-            if stat['total_count'] == 0:
-                continue
-            
-            # Determine button style based on severity
-            if stat['severity'] == 'CRITICAL':
-                style = 'Error.TButton'
-            elif stat['severity'] == 'WARNING':
-                style = 'Warning.TButton'
-            else:
-                style = 'TButton'
-            
-            # Create button with error info
-            btn_text = f"{stat['error_code']}\n{stat['total_count']} total\n{stat['open_count']} open"
-            
-            btn = ttk.Button(self.stats_scrollable_frame, text=btn_text, style=style,
-                           command=lambda ec=stat['error_code']: self.show_error_type_details(ec))
-            btn.grid(row=row, column=col, padx=5, pady=5, sticky='ew')
-            
-            # Add tooltip
-            self.create_tooltip(btn, f"{stat['description']}\nSeverity: {stat['severity']}")
+            self.stats_tree.insert('', 'end', iid=stat['error_code'], tags=(stat['severity'],), values=(
+                stat['error_code'],
+                stat['total_count'],
+                stat['open_count'],
+                stat['fixed_count'],
+                stat['severity'],
+                stat['description']
+            ))
+            self._stats_ids.append(stat['error_code'])
+            self.stats_tooltip.texts[stat['error_code']] = f"{stat['description']}\nSeverity: {stat['severity']}"
             
             # Update totals
             total_errors += stat['total_count']
             total_open += stat['open_count']
             total_fixed += stat['fixed_count']
-            
-            col += 1
-            if col >= 4:  # 4 buttons per row
-                col = 0
-                row += 1
-        
-        # Configure column weights
-        for i in range(4):
-            self.stats_scrollable_frame.columnconfigure(i, weight=1)
         
         # Update summary
-        self.summary_text.config(state='normal')
-        self.summary_text.delete(1.0, tk.END)
-        
         summary = f"""Total Errors: {total_errors}
 Open Errors: {total_open}
 Fixed Errors: {total_fixed}
@@ -537,92 +731,130 @@ Most Common Issues:
 """
         
         # Add top 5 error types
-        sorted_stats = sorted([s for s in stats if s['total_count'] > 0], 
-                             key=lambda x: x['total_count'], reverse=True)
-        
-        for i, stat in enumerate(sorted_stats[:5]):
+        for i, stat in enumerate(stats[:5]):
             summary += f"{i+1}. {stat['error_code']}: {stat['total_count']} occurrences\n"
         
-        self.summary_text.insert(1.0, summary)
+        # Swap the text in one edit so Tk reflows it once
+        self.summary_text.config(state='normal')
+        self.summary_text.replace('1.0', tk.END, summary)
         self.summary_text.config(state='disabled')
     
     def on_translation_selected(self, event=None):
         """Handle translation selection"""
+        self._debounce('translation', self._do_translation_selected)
+    
+    def _on_book_var_write(self, *args):
+        """Keep current_book_abbrev in step with the book combo"""
+        book_str = self.current_book.get()
+        abbrev = self._book_abbrevs.get(book_str)
+        if abbrev is None and book_str:
+            abbrev = book_str.split(' ', 1)[0]
+        self.current_book_abbrev = abbrev
+    
+    def _on_chapter_var_write(self, *args):
+        """Keep current_chapter_num in step with the chapter combo"""
+        try:
+            self.current_chapter_num = int(self.current_chapter.get())
+        except ValueError:
+            self.current_chapter_num = None
+    
+    def _do_translation_selected(self):
+        """Load books for the selected translation"""
         translation = self.current_translation.get()
         if not translation:
             return
         
-        # Load books for this translation
-        books = self.db.get_books(translation)
-        book_values = [f"{book['book']} ({book['book_name']})" for book in books]
-        self.book_combo['values'] = book_values
-        
         # Clear current selections
         self.current_book.set('')
         self.current_chapter.set('')
         self.clear_verse_list()
+        
+        # Load books for this translation
+        def populate_books(books):
+            if self.current_translation.get() != translation:
+                return  # selection moved on while the query ran
+            self._book_abbrevs = {f"{book['book']} ({book['book_name']})": book['book'] for book in books}
+            self.set_combo_values(self.book_combo, self._book_abbrevs)
+        
+        self.run_cached_db_query(('books', translation), self.db.get_books, populate_books, translation)
     
     def on_book_selected(self, event=None):
         """Handle book selection"""
-        book_str = self.current_book.get()
+        self._debounce('book', self._do_book_selected)
+    
+    def _do_book_selected(self):
+        """Load chapters for the selected book"""
+        book = self.current_book_abbrev
         translation = self.current_translation.get()
         
-        if not book_str or not translation:
+        if not book or not translation:
             return
         
-        # Extract book abbreviation
-        book = book_str.split(' ')[0]
+        self.current_chapter.set('')
+        self.clear_verse_list()
         
         # Load chapters for this book
-        chapters = self.db.get_chapters(translation, book)
-        chapter_values = [str(ch['chapter']) for ch in chapters]
-        self.chapter_combo['values'] = chapter_values
+        def populate_chapters(chapters):
+            if (self.current_translation.get(), self.current_book_abbrev) != (translation, book):
+                return  # selection moved on while the query ran
+            self.set_combo_values(self.chapter_combo, (str(ch['chapter']) for ch in chapters))
         
-        self.current_chapter.set('')
-        self.clear_verse_list()
+        self.run_cached_db_query(('chapters', translation, book), self.db.get_chapters,
+                                 populate_chapters, translation, book)
     
     def on_chapter_selected(self, event=None):
         """Handle chapter selection"""
-        self.load_verses()
+        self._debounce('chapter', self.load_verses)
     
     def load_verses(self):
         """Load verses for current selection"""
         translation = self.current_translation.get()
-        book_str = self.current_book.get()
-        chapter_str = self.current_chapter.get()
+        book = self.current_book_abbrev
+        chapter = self.current_chapter_num
         
-        if not all([translation, book_str, chapter_str]):
+        if not translation or not book or chapter is None:
             return
         
-        book = book_str.split(' ')[0]
-        try:
-            chapter = int(chapter_str)
-        except ValueError:
+        # Get verses; rows are formatted on the worker so the Tk thread
+        # only reconciles the tree
+        def fetch_verses():
+            verses = self.db.get_verses(translation=translation, book=book, chapter=chapter,
+                                        parse_dates=False)
+            return verses, format_verse_rows(verses)
+        
+        request = (translation, book, chapter)
+        self._verse_request = request
+        
+        cached = self._verse_cache.get(request)
+        if cached is not None:
+            self._verse_cache.move_to_end(request)
+            self._populate_verses(request, *cached)
             return
         
-        # Get verses
-        verses = self.db.get_verses(translation=translation, book=book, chapter=chapter)
+        def store(result):
+            self._verse_cache[request] = result
+            if len(self._verse_cache) > VERSE_CACHE_SIZE:
+                self._verse_cache.popitem(last=False)
+            self._populate_verses(request, *result)
         
-        # Clear existing items
-        self.verse_tree.delete(*self.verse_tree.get_children())
+        self.run_db_query(fetch_verses, store)
+    
+    def _populate_verses(self, request: tuple, verses: List, rows: List[tuple]):
+        """Show verses fetched for request if it is still the current selection"""
+        if request != self._verse_request:
+            return
         
-        # Add verses to tree
-        for verse in verses:
-            status = "❌ Error" if verse.has_errors else "✅ Clean"
-            if verse.corrected_text:
-                status = "✏️ Edited"
-            
-            preview = verse.original_text[:50] + "..." if len(verse.original_text) > 50 else verse.original_text
-            
-            self.verse_tree.insert('', 'end', values=(
-                f"{verse.book} {verse.chapter}:{verse.verse}",
-                preview,
-                status
-            ), tags=(str(verse.id),))
+        self._verses_by_id = {verse.id: verse for verse in verses}
+        
+        # The loader reuses rows already in the tree and only inserts what is
+        # scrolled into view
+        self.verse_rows.set_rows(rows)
     
     def clear_verse_list(self):
         """Clear verse list"""
-        self.verse_tree.delete(*self.verse_tree.get_children())
+        self._verse_request = None
+        self._verses_by_id = {}
+        self.verse_rows.clear()
         self.clear_verse_editor()
     
     def on_verse_selected(self, event=None):
@@ -631,17 +863,12 @@ Most Common Issues:
         if not selection:
             return
         
-        item = self.verse_tree.item(selection[0])
-        tags = item.get('tags', [])
-        
-        if tags:
-            verse_id = int(tags[0])
-            self.load_verse_editor(verse_id)
+        # Row iids are verse ids
+        self.load_verse_editor(int(selection[0]))
     
     def load_verse_editor(self, verse_id: int):
         """Load verse into editor"""
-        verses = self.db.get_verses()
-        verse = next((v for v in verses if v.id == verse_id), None)
+        verse = self._verses_by_id.get(verse_id) or self.db.get_verse_by_id(verse_id)
         
         if not verse:
             return
@@ -697,6 +924,9 @@ Most Common Issues:
             return
         
         if self.db.update_verse(self.selected_verse_id, corrected_text, notes):
+            verse = self._verses_by_id.get(self.selected_verse_id)
+            if verse:
+                self._verse_cache.pop((verse.translation, verse.book, verse.chapter), None)
             self.set_status("Changes saved successfully")
             self.load_verses()  # Refresh the list
             messagebox.showinfo("Success", "Verse updated successfully!")
@@ -777,12 +1007,11 @@ Most Common Issues:
         
         for result in results:
             ref = f"{result['book']} {result['chapter']}:{result['verse']}"
-            text = result['original_text'][:100] + "..." if len(result['original_text']) > 100 else result['original_text']
             
             tree.insert('', 'end', values=(
                 result['translation'],
                 ref,
-                text
+                result['original_text_short']
             ))
         
         tree.pack(fill='both', expand=True, padx=10, pady=10)
@@ -798,53 +1027,81 @@ Most Common Issues:
         
         tree.bind('<Double-1>', goto_verse)
     
+    def on_error_filter_changed(self, event=None):
+        """Handle status/error type filter changes"""
+        self._debounce('error_filter', self.refresh_errors_list)
+    
     def refresh_errors_list(self, event=None):
-        """Refresh errors list based on filters"""
-        status = self.filter_status.get()
-        error_type = self.filter_error_type.get()
-        
-        # Get filtered errors
-        error_type_id = None
-        if error_type != "All":
-            error_types = self.db.get_error_types()
-            error_type_obj = next((et for et in error_types if et['error_code'] == error_type), None)
-            if error_type_obj:
-                error_type_id = error_type_obj['id']
+        """Reload the errors list from the database with the current filters
         
-        status_filter = status if status != 'all' else None
-        errors = self.db.get_error_instances(status=status_filter, error_type_id=error_type_id)
-        
-        # Clear tree
-        self.errors_tree.delete(*self.errors_tree.get_children())
+        Only the first ERROR_PAGE_SIZE matching errors are fetched; the next
+        page is requested when the list is scrolled near its end.
+        """
+        self._load_error_page(self._start_error_listing())
+    
+    def _start_error_listing(self) -> int:
+        """Reset paging for a reload with the current filters; returns its generation"""
+        status = self.filter_status.get()
+        error_type = self.db.get_error_types_by_code().get(self.filter_error_type.get())
+        self._error_filters = (
+            None if status == 'all' else status,
+            error_type['id'] if error_type else None  # "All" or an unknown code
+        )
+        self._errors_cursor = None
+        self._errors_exhausted = False
+        self._error_page_pending = True
+        self._errors_generation += 1
+        return self._errors_generation
+    
+    def _load_error_page(self, generation: int):
+        """Fetch and format the next page of errors on the database worker"""
+        status, error_type_id = self._error_filters
+        cursor = self._errors_cursor
+        self._error_page_pending = True
+        
+        def fetch_page():
+            errors = self.db.get_error_instances(
+                status=status, error_type_id=error_type_id, limit=ERROR_PAGE_SIZE, before=cursor
+            )
+            return format_error_rows(errors), error_page_cursor(errors)
+        
+        self.run_db_query(fetch_page, lambda page: self._add_error_page(generation, *page),
+                          on_error=lambda e: self._error_page_failed(generation, e))
+    
+    def _add_error_page(self, generation: int, rows: List[tuple], cursor: Optional[tuple]):
+        """Show a fetched page of errors below the ones already listed"""
+        if generation != self._errors_generation:
+            return  # a newer reload replaced this one
+        
+        # The loader only inserts what is scrolled into view
+        if self._errors_cursor is None:
+            self.errors_rows.set_rows(rows)
+        else:
+            self.errors_rows.extend(rows)
         
-        # Add errors
-        for error in errors:
-            ref = f"{error['book']} {error['chapter']}:{error['verse']}"
-            
-            self.errors_tree.insert('', 'end', values=(
-                error['id'],
-                error['translation'],
-                ref,
-                error['error_code'],
-                error['severity'],
-                error['status'],
-                error['error_text'][:50] + "..." if len(error['error_text']) > 50 else error['error_text']
-            ), tags=(str(error['id']),))
+        if cursor is not None:
+            self._errors_cursor = cursor
+        self._errors_exhausted = len(rows) < ERROR_PAGE_SIZE
+        self._error_page_pending = False
+    
+    def _error_page_failed(self, generation: int, error: Exception):
+        """Report a failed page fetch; scrolling to the end retries it"""
+        if generation == self._errors_generation:
+            self._error_page_pending = False
+        self.set_status(f"Database error: {error}")
+    
+    def _load_more_errors(self):
+        """errors_rows hook: fetch the next page once every fetched row is shown"""
+        if self._error_filters is None or self._error_page_pending or self._errors_exhausted:
+            return
+        self._load_error_page(self._errors_generation)
     
     def show_error_context_menu(self, event):
         """Show context menu for error items"""
         item = self.errors_tree.identify_row(event.y)
         if item:
             self.errors_tree.selection_set(item)
-            
-            context_menu = tk.Menu(self.root, tearoff=0)
-            context_menu.add_command(label="Mark as Fixed", command=self.mark_error_fixed)
-            context_menu.add_command(label="Mark as Ignored", command=self.mark_error_ignored)
-            context_menu.add_command(label="Reopen Error", command=self.reopen_error)
-            context_menu.add_separator()
-            context_menu.add_command(label="View Details", command=self.view_error_details)
-            
-            context_menu.post(event.x_root, event.y_root)
+            self.error_context_menu.post(event.x_root, event.y_root)
     
     def mark_error_fixed(self):
         """Mark selected error as fixed"""
@@ -852,8 +1109,7 @@ Most Common Issues:
         if not selection:
             return
         
-        item = self.errors_tree.item(selection[0])
-        error_id = int(item['tags'][0])
+        error_id = int(selection[0])
         
         notes = tk.simpledialog.askstring("Resolution Notes", 
                                          "Enter resolution notes (optional):")
@@ -868,8 +1124,7 @@ Most Common Issues:
         if not selection:
             return
         
-        item = self.errors_tree.item(selection[0])
-        error_id = int(item['tags'][0])
+        error_id = int(selection[0])
         
         notes = tk.simpledialog.askstring("Ignore Reason", 
                                          "Why is this error being ignored?")
@@ -884,8 +1139,7 @@ Most Common Issues:
         if not selection:
             return
         
-        item = self.errors_tree.item(selection[0])
-        error_id = int(item['tags'][0])
+        error_id = int(selection[0])
         
         if self.db.resolve_error(error_id, 'open', "Reopened"):
             self.refresh_errors_list()
@@ -897,12 +1151,10 @@ Most Common Issues:
         if not selection:
             return
         
-        item = self.errors_tree.item(selection[0])
-        error_id = int(item['tags'][0])
-        
-        errors = self.db.get_error_instances()
-        error = next((e for e in errors if e['id'] == error_id), None)
-        
+        self.run_db_query(self.db.get_error_by_id, self._show_error_details, int(selection[0]))
+    
+    def _show_error_details(self, error: Optional[Dict]):
+        """Fill the error details pane"""
         if not error:
             return
         
@@ -927,6 +1179,12 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
         self.error_details_text.insert(1.0, details)
         self.error_details_text.config(state='disabled')
     
+    def on_stats_double_click(self, event):
+        """Open the errors tab filtered to the double-clicked error type"""
+        error_code = self.stats_tree.identify_row(event.y)
+        if error_code:
+            self.show_error_type_details(error_code)
+    
     def show_error_type_details(self, error_code: str):
         """Show details for a specific error type"""
         # Filter errors by type
@@ -948,21 +1206,22 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
         
         # Show progress
         self.show_progress(True)
-        self.progress_var.set(0)
+        self.set_progress(0)
         
         def import_worker():
             """Background import worker"""
+            from bible_correction_system import parse_bible_json
+            
             successful = 0
             failed = 0
             
-            for i, file_path in enumerate(files):
+            def store(file_path, parse):
+                nonlocal successful, failed
                 try:
-                    self.set_status(f"Importing {Path(file_path).name}...")
-                    
-                    def progress_callback(count, description):
-                        self.set_status(f"Importing {Path(file_path).name}: {count} {description}")
-                    
-                    result = self.db.import_json_file(Path(file_path), progress_callback=progress_callback)
+                    parsed = parse()
+                    # Only the write goes through the database worker, so GUI
+                    # reads can run while other files are still parsing
+                    result = self._db_executor.submit(self.db.store_parsed_bible, parsed).result()
                     successful += 1
                     
                     self.set_status(f"Imported {result['translation']}: {result['total_verses']} verses")
@@ -972,10 +1231,36 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
                     self.set_status(f"Failed to import {Path(file_path).name}: {e}")
                 
                 # Update progress
-                self.progress_var.set((i + 1) / len(files) * 100)
+                self.set_progress((successful + failed) / len(files) * 100)
+            
+            if len(files) == 1:
+                # A single file is parsed here so progress can be reported
+                file_path = files[0]
+                self.set_status(f"Importing {Path(file_path).name}...")
+                
+                def progress_callback(count, description):
+                    self.set_status(f"Importing {Path(file_path).name}: {count} {description}")
+                
+                store(file_path, lambda: parse_bible_json(Path(file_path), progress_callback=progress_callback))
+            else:
+                # Parsing is CPU bound, so spread files over processes; inserts
+                # are serialized on the database worker as each file finishes.
+                # Workers are spawned: forking this threaded Tk process could
+                # copy a lock some other thread holds into the children.
+                self.set_status(f"Parsing {len(files)} files...")
+                with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1),
+                                         mp_context=multiprocessing.get_context('spawn')) as pool:
+                    parsing = {pool.submit(parse_bible_json, Path(file_path)): file_path for file_path in files}
+                    for future in as_completed(parsing):
+                        store(parsing[future], future.result)
+            
+            # Once per batch, on the connection that did the inserts
+            if successful:
+                self._db_executor.submit(self.db.optimize).result()
             
             # Refresh UI
             self.root.after(0, lambda: [
+                self.clear_caches(),
                 self.refresh_translations(),
                 self.show_progress(False),
                 self.set_status(f"Import complete: {successful} successful, {failed} failed"),
@@ -983,10 +1268,7 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
                                   f"Import finished:\n{successful} files imported successfully\n{failed} files failed")
             ])
         
-        # Run import in background thread
-        thread = threading.Thread(target=import_worker)
-        thread.daemon = True
-        thread.start()
+        self._task_executor.submit(import_worker)
     
     def export_translation(self):
         """Export translation to JSON"""
@@ -1011,16 +1293,27 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
         if not file_path:
             return
         
-        try:
-            data = self.db.export_translation(translation, dialog.use_corrected)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+        use_corrected = dialog.use_corrected
+        
+        def write_export():
+            from bible_correction_system import write_json_file
             
+            write_json_file(file_path, self.db.export_translation(translation, use_corrected))
+        
+        self.show_progress(True)
+        self.set_status(f"Exporting {translation}...")
+        
+        def on_done(result):
+            self.show_progress(False)
+            self.set_status(f"Exported {translation}")
             messagebox.showinfo("Export Complete", f"Translation exported to {file_path}")
-            
-        except Exception as e:
+        
+        def on_error(e):
+            self.show_progress(False)
+            self.set_status(f"Export of {translation} failed")
             messagebox.showerror("Export Error", f"Failed to export translation: {e}")
+        
+        self.run_db_query(write_export, on_done, on_error=on_error)
     
     def export_error_report(self):
         """Export error report to CSV"""
@@ -1034,9 +1327,7 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
         if not file_path:
             return
         
-        try:
-            errors = self.db.get_error_instances()
-            
+        def write_report():
             with open(file_path, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 
@@ -1047,20 +1338,18 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
                     'Detected Date', 'Resolved Date', 'Resolution Notes'
                 ])
                 
-                # Write data
-                for error in errors:
-                    writer.writerow([
-                        error['id'], error['translation'], error['book'],
-                        error['chapter'], error['verse'], error['error_code'],
-                        error['severity'], error['status'], error['error_text'],
-                        error['context'], error['detected_date'],
-                        error['resolved_date'], error['resolution_notes']
-                    ])
-            
-            messagebox.showinfo("Export Complete", f"Error report exported to {file_path}")
-            
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export error report: {e}")
+                # Rows stream from the cursor straight into the file
+                writer.writerows(self.db.iter_error_report_rows())
+        
+        self.set_status("Exporting error report...")
+        self.run_db_query(
+            write_report,
+            lambda result: [
+                self.set_status("Error report exported"),
+                messagebox.showinfo("Export Complete", f"Error report exported to {file_path}")
+            ],
+            on_error=lambda e: messagebox.showerror("Export Error", f"Failed to export error report: {e}")
+        )
     
     def scan_for_errors(self):
         """Scan translations for errors"""
@@ -1077,20 +1366,20 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
         
         # Show progress
         self.show_progress(True)
-        self.progress_var.set(0)
+        self.set_progress(0)
         
         def scan_worker():
             """Background scan worker"""
             from bible_correction_system import ErrorDetectionEngine
             
-            engine = ErrorDetectionEngine(self.db)
+            engine = ErrorDetectionEngine(self.db, dialog.near_duplicates)
             total_translations = len(dialog.selected_translations)
             
             for i, translation in enumerate(dialog.selected_translations):
                 try:
                     def progress_callback(current, total, description):
                         progress = (i / total_translations + (current / total) / total_translations) * 100
-                        self.progress_var.set(progress)
+                        self.set_progress(progress)
                         self.set_status(f"Scanning {translation}: {description}")
                     
                     result = engine.scan_translation(translation, progress_callback)
@@ -1099,10 +1388,13 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
                 except Exception as e:
                     self.set_status(f"Error scanning {translation}: {e}")
                 
-                self.progress_var.set((i + 1) / total_translations * 100)
+                self.set_progress((i + 1) / total_translations * 100)
+            
+            self.db.optimize()
             
             # Refresh UI
             self.root.after(0, lambda: [
+                self._verse_cache.clear(),
                 self.refresh_error_statistics(),
                 self.refresh_errors_list(),
                 self.show_progress(False),
@@ -1110,10 +1402,8 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
                 messagebox.showinfo("Scan Complete", "Error scanning finished.")
             ])
         
-        # Run scan in background thread
-        thread = threading.Thread(target=scan_worker)
-        thread.daemon = True
-        thread.start()
+        # Run the scan on the task worker so GUI reads are not queued behind it
+        self._task_executor.submit(scan_worker)
     
     def delete_translation(self):
         """Delete selected translation"""
@@ -1122,23 +1412,19 @@ Resolution Notes: {error['resolution_notes'] or 'None'}
             messagebox.showwarning("No Selection", "Please select a translation to delete.")
             return
         
-        item = self.trans_tree.item(selection[0])
-        translation = item['values'][0]
+        translation = selection[0]
         
         if messagebox.askyesno("Confirm Delete", 
                               f"Are you sure you want to delete translation '{translation}'?\n"
                               "This will remove all verses and associated errors."):
-            try:
-                # Delete from database
-                self.db.conn.execute("DELETE FROM bible_verses WHERE translation = ?", (translation,))
-                self.db.conn.execute("DELETE FROM translations WHERE abbrev = ?", (translation,))
-                self.db.conn.commit()
-                
-                self.refresh_translations()
-                self.set_status(f"Translation {translation} deleted")
-                
-            except Exception as e:
-                messagebox.showerror("Delete Error", f"Failed to delete translation: {e}")
+            def on_done(result):
+                self.refresh_all(f"Translation {translation} deleted")
+            
+            self.set_status(f"Deleting {translation}...")
+            self.run_db_query(
+                self.db.delete_translation, on_done, translation,
+                on_error=lambda e: messagebox.showerror("Delete Error", f"Failed to delete translation: {e}")
+            )
     
     def show_bulk_operations(self):
         """Show bulk operations dialog"""
@@ -1170,20 +1456,39 @@ Translation Details:
         if not selection:
             return
         
-        item = self.trans_tree.item(selection[0])
-        translation = item['values'][0]
+        translation = selection[0]
         
         # Switch to editor tab and select this translation
         self.current_translation.set(translation)
         self.on_translation_selected()
         self.notebook.select(1)  # Editor tab
     
-    def refresh_all(self):
-        """Refresh all data"""
-        self.refresh_translations()
-        self.refresh_error_statistics()
-        self.refresh_errors_list()
-        self.set_status("All data refreshed")
+    def refresh_all(self, message: str = "All data refreshed"):
+        """Refresh all data
+        
+        Translations, statistics and the first page of errors come from a
+        single worker round trip; further error pages are fetched on scroll.
+        """
+        self.clear_caches()
+        generation = self._start_error_listing()
+        status, error_type_id = self._error_filters
+        
+        def fetch_snapshot():
+            snapshot = self.db.get_dashboard_snapshot(
+                error_limit=ERROR_PAGE_SIZE, error_status=status, error_type_id=error_type_id
+            )
+            errors = snapshot['recent_errors']
+            snapshot['recent_errors'] = (format_error_rows(errors), error_page_cursor(errors))
+            return snapshot
+        
+        def populate(snapshot):
+            self._populate_translations(snapshot['translations'])
+            self._populate_error_statistics(snapshot['error_stats'])
+            self._add_error_page(generation, *snapshot['recent_errors'])
+            self.set_status(message)
+        
+        self.run_db_query(fetch_snapshot, populate,
+                          on_error=lambda e: self._error_page_failed(generation, e))
     
     def show_help(self):
         """Show help dialog"""
@@ -1230,27 +1535,135 @@ Built with Python and tkinter.
 """
         
         messagebox.showinfo("About", about_text)
+
+# Treeview helpers
+class TreeRowLoader:
+    """Materializes Treeview rows on demand as the view scrolls
     
-    def create_tooltip(self, widget, text):
-        """Create tooltip for widget"""
-        def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            
-            label = tk.Label(tooltip, text=text, background="yellow", 
-                           relief="solid", borderwidth=1, font=("Arial", 8))
-            label.pack()
-            
-            widget.tooltip = tooltip
-        
-        def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
+    Keeps the full row list in Python and only inserts the next chunk into
+    the tree once the view nears the end of what has been inserted so far.
+    Once every row is inserted, fetch_more (if given) is called so the owner
+    can fetch more rows and pass them to extend().
+    Rows are inserted with a direct Tcl call so a chunk costs one round trip
+    per row with no ttk option formatting; Tk coalesces the redraw for the
+    whole chunk into a single idle pass.
+    """
+    
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar, chunk_size: int = 200,
+                 fetch_more=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.chunk_size = chunk_size
+        self.fetch_more = fetch_more
+        self.rows = []
+        self.loaded = 0
+        self.shown = {}  # iid -> values for rows inserted so far, in tree order
+        
+        tree.configure(yscrollcommand=self.on_scroll)
+    
+    def set_rows(self, rows: List[tuple]):
+        """Show (iid, values) rows, reusing items that are already in the tree"""
+        self.rows = list(rows)  # extend() appends to it
+        target = min(len(rows), max(self.loaded, self.chunk_size))
+        wanted = rows[:target]
+        wanted_ids = {iid for iid, _ in wanted}
+        shown = self.shown
+        
+        stale = [iid for iid in shown if iid not in wanted_ids]
+        if stale:
+            self.tree.delete(*stale)
+        
+        kept = [iid for iid in shown if iid in wanted_ids]
+        if kept != [iid for iid, _ in wanted if iid in shown]:
+            # Order changed; rebuilding is simpler than moving every row
+            self.tree.delete(*kept)
+            shown = {}
+        
+        for index, (iid, values) in enumerate(wanted):
+            old_values = shown.get(iid)
+            if old_values is None:
+                self._insert(index, iid, values)
+            elif old_values != values:
+                self.tree.item(iid, values=values)
+        
+        self.shown = dict(wanted)
+        self.loaded = target
+    
+    def _insert(self, index, iid: str, values: tuple):
+        """Insert one row, bypassing Treeview.insert's option handling"""
+        self.tree.tk.call(self.tree._w, 'insert', '', index, '-id', iid, '-values', values)
+    
+    def extend(self, rows: List[tuple]):
+        """Append (iid, values) rows after the current ones"""
+        self.rows.extend(rows)
+        # Fill the view straight away if it was left at the end of the list
+        if float(self.tree.yview()[1]) > 0.9:
+            self.load_more()
+    
+    def clear(self):
+        """Remove all rows"""
+        self.set_rows([])
+    
+    def load_more(self):
+        """Insert the next chunk of rows into the tree"""
+        end = min(self.loaded + self.chunk_size, len(self.rows))
+        for iid, values in self.rows[self.loaded:end]:
+            self._insert('end', iid, values)
+            self.shown[iid] = values
+        self.loaded = end
+    
+    def on_scroll(self, first, last):
+        """yscrollcommand hook: update the scrollbar and load ahead"""
+        self.scrollbar.set(first, last)
+        if float(last) > 0.9:
+            if self.loaded < len(self.rows):
+                self.load_more()
+            elif self.fetch_more:
+                self.fetch_more()
+
+class TreeTooltip:
+    """Single hover tooltip shared by every row of a Treeview
+    
+    texts maps row iid to tooltip text. One Toplevel is created on first use
+    and moved or hidden as the pointer crosses rows.
+    """
+    
+    def __init__(self, tree: ttk.Treeview):
+        self.tree = tree
+        self.texts = {}
+        self.window = None
+        self.label = None
+        self.current = None  # iid the tooltip is showing
+        
+        tree.bind('<Motion>', self.on_motion, add='+')
+        tree.bind('<Leave>', self.hide, add='+')
+    
+    def on_motion(self, event):
+        """Show the text for the row under the pointer"""
+        iid = self.tree.identify_row(event.y)
+        text = self.texts.get(iid)
+        if text is None:
+            self.hide()
+            return
         
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        if self.window is None:
+            self.window = tk.Toplevel(self.tree)
+            self.window.wm_overrideredirect(True)
+            self.label = tk.Label(self.window, background="yellow",
+                                  relief="solid", borderwidth=1, font=("Arial", 8))
+            self.label.pack()
+        
+        self.window.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+        if iid != self.current:
+            self.label.configure(text=text)
+            self.window.deiconify()
+            self.current = iid
+    
+    def hide(self, event=None):
+        """Hide the tooltip"""
+        if self.window is not None and self.current is not None:
+            self.window.withdraw()
+        self.current = None
 
 # Helper dialog classes
 class ExportDialog:
@@ -1296,7 +1709,11 @@ class ScanDialog:
     """Dialog for selecting translations to scan"""
     
     def __init__(self, parent, translations):
+        from bible_correction_system import DATASKETCH_AVAILABLE
+        
         self.selected_translations = []
+        self.near_duplicates = False
+        self.near_duplicates_var = tk.BooleanVar(value=False)
         
         dialog = tk.Toplevel(parent)
         dialog.title("Scan for Errors")
@@ -1320,6 +1737,13 @@ class ScanDialog:
         self.listbox.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
         
+        # Near-duplicate detection is opt-in: it is slow and needs datasketch
+        near_duplicates_text = "Also find near-duplicate verses (slower)"
+        if not DATASKETCH_AVAILABLE:
+            near_duplicates_text += " - requires datasketch"
+        ttk.Checkbutton(dialog, text=near_duplicates_text, variable=self.near_duplicates_var,
+                        state='normal' if DATASKETCH_AVAILABLE else 'disabled').pack(padx=20, anchor='w')
+        
         # Buttons
         button_frame = ttk.Frame(dialog)
         button_frame.pack(pady=10)
@@ -1344,6 +1768,7 @@ class ScanDialog:
     def on_ok(self):
         selected_indices = self.listbox.curselection()
         self.selected_translations = [self.listbox.get(i) for i in selected_indices]
+        self.near_duplicates = self.near_duplicates_var.get()
         self.dialog.destroy()
     
     def on_cancel(self):
@@ -1400,44 +1825,59 @@ class BulkOperationsDialog:
         # Close button
         ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
     
+    def run_bulk_operation(self, operation, message, refresh, *args, **kwargs):
+        """Run a bulk database operation on the worker and report how many rows changed"""
+        def on_done(count):
+            messagebox.showinfo("Complete", message.format(count=count))
+            refresh()
+        
+        self.main_gui.run_db_query(
+            operation, on_done, *args,
+            on_error=lambda e: messagebox.showerror("Bulk Operation Error", f"Bulk operation failed: {e}"),
+            **kwargs
+        )
+    
     def fix_whitespace_errors(self):
         """Mark all whitespace errors as fixed"""
         if messagebox.askyesno("Confirm", "Mark all whitespace issues as fixed?"):
-            # Implementation here
-            messagebox.showinfo("Complete", "Whitespace errors marked as fixed")
-            self.main_gui.refresh_errors_list()
+            self.run_bulk_operation(self.db.bulk_set_error_status,
+                                    "{count} whitespace errors marked as fixed",
+                                    self.main_gui.refresh_errors_list,
+                                    'fixed', error_code='WHITESPACE_ISSUES')
     
     def ignore_capitalization_errors(self):
         """Ignore all capitalization errors"""
         if messagebox.askyesno("Confirm", "Ignore all capitalization issues?"):
-            # Implementation here
-            messagebox.showinfo("Complete", "Capitalization errors ignored")
-            self.main_gui.refresh_errors_list()
+            self.run_bulk_operation(self.db.bulk_set_error_status,
+                                    "{count} capitalization errors ignored",
+                                    self.main_gui.refresh_errors_list,
+                                    'ignored', error_code='CAPITALIZATION_ISSUES')
     
     def reopen_fixed_errors(self):
         """Reopen all fixed errors"""
         if messagebox.askyesno("Confirm", "Reopen all fixed errors? This cannot be undone."):
-            # Implementation here
-            messagebox.showinfo("Complete", "Fixed errors reopened")
-            self.main_gui.refresh_errors_list()
+            self.run_bulk_operation(self.db.bulk_set_error_status,
+                                    "{count} fixed errors reopened",
+                                    self.main_gui.refresh_errors_list,
+                                    'open', from_status='fixed')
     
     def auto_fix_spaces(self):
         """Auto-fix multiple spaces in all verses"""
         if messagebox.askyesno("Confirm", "Auto-fix multiple spaces in all verses?"):
-            # Implementation here
-            messagebox.showinfo("Complete", "Multiple spaces fixed")
-            self.main_gui.refresh_all()
+            self.run_bulk_operation(self.db.collapse_multiple_spaces,
+                                    "Multiple spaces fixed in {count} verses",
+                                    self.main_gui.refresh_all)
     
     def auto_trim_whitespace(self):
         """Auto-trim whitespace from all verses"""
         if messagebox.askyesno("Confirm", "Auto-trim whitespace from all verses?"):
-            # Implementation here
-            messagebox.showinfo("Complete", "Whitespace trimmed")
-            self.main_gui.refresh_all()
+            self.run_bulk_operation(self.db.trim_verse_whitespace,
+                                    "Whitespace trimmed in {count} verses",
+                                    self.main_gui.refresh_all)
     
     def reset_corrections(self):
         """Reset all corrections"""
         if messagebox.askyesno("Confirm", "Reset ALL corrections? This cannot be undone!"):
-            # Implementation here
-            messagebox.showinfo("Complete", "All corrections reset")
-            self.main_gui.refresh_all()
\ No newline at end of file
+            self.run_bulk_operation(self.db.reset_corrections,
+                                    "Corrections reset on {count} verses",
+                                    self.main_gui.refresh_all)
\ No newline at end of file
@@ -14,6 +14,8 @@ Features:
 
 Usage:
     python3 bible_correction_system.py
+    python3 bible_correction_system.py --headless [--near-duplicates]
+        [--fail-on {error,warning}] [TRANSLATION ...]
 """
 
 import sqlite3
@@ -22,19 +24,53 @@ import re
 import os
 import sys
 import logging
+import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 import unicodedata
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, scrolledtext
+import hashlib
 import threading
 import csv
+import itertools
+import multiprocessing
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_json_file(path, data: Any):
+    """Write data as 2-space indented UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
 
 @dataclass
 class VerseData:
     """Represents a Bible verse with correction metadata"""
+    # Slots instead of a per-instance __dict__; whole translations are loaded at once
+    __slots__ = ('id', 'translation', 'book', 'book_name', 'chapter', 'verse',
+                 'original_text', 'corrected_text', 'last_modified',
+                 'correction_notes', 'has_errors')
     id: Optional[int]
     translation: str
     book: str
@@ -50,6 +86,8 @@ class VerseData:
 @dataclass
 class ErrorInstance:
     """Represents an error instance in the database"""
+    __slots__ = ('id', 'verse_id', 'error_type_id', 'status', 'error_text', 'context',
+                 'line_reference', 'detected_date', 'resolved_date', 'resolution_notes')
     id: Optional[int]
     verse_id: int
     error_type_id: int
@@ -61,20 +99,183 @@ class ErrorInstance:
     resolved_date: Optional[datetime]
     resolution_notes: Optional[str]
 
+# Full book names for the abbreviations used in the JSON files
+BOOK_NAMES = {
+    'Gen': 'Genesis', 'Exo': 'Exodus', 'Lev': 'Leviticus', 'Num': 'Numbers', 'Deu': 'Deuteronomy',
+    'Jos': 'Joshua', 'Jdg': 'Judges', 'Rut': 'Ruth', '1Sa': '1 Samuel', '2Sa': '2 Samuel',
+    '1Ki': '1 Kings', '2Ki': '2 Kings', '1Ch': '1 Chronicles', '2Ch': '2 Chronicles',
+    'Ezr': 'Ezra', 'Neh': 'Nehemiah', 'Est': 'Esther', 'Job': 'Job', 'Psa': 'Psalms',
+    'Pro': 'Proverbs', 'Ecc': 'Ecclesiastes', 'Son': 'Song of Songs', 'Isa': 'Isaiah',
+    'Jer': 'Jeremiah', 'Lam': 'Lamentations', 'Eze': 'Ezekiel', 'Dan': 'Daniel',
+    'Hos': 'Hosea', 'Joe': 'Joel', 'Amo': 'Amos', 'Oba': 'Obadiah', 'Jon': 'Jonah',
+    'Mic': 'Micah', 'Nah': 'Nahum', 'Hab': 'Habakkuk', 'Zep': 'Zephaniah', 'Hag': 'Haggai',
+    'Zec': 'Zechariah', 'Mal': 'Malachi', 'Mat': 'Matthew', 'Mar': 'Mark', 'Luk': 'Luke',
+    'Joh': 'John', 'Act': 'Acts', 'Rom': 'Romans', '1Co': '1 Corinthians', '2Co': '2 Corinthians',
+    'Gal': 'Galatians', 'Eph': 'Ephesians', 'Phi': 'Philippians', 'Col': 'Colossians',
+    '1Th': '1 Thessalonians', '2Th': '2 Thessalonians', '1Ti': '1 Timothy', '2Ti': '2 Timothy',
+    'Tit': 'Titus', 'Phm': 'Philemon', 'Heb': 'Hebrews', 'Jas': 'James', '1Pe': '1 Peter',
+    '2Pe': '2 Peter', '1Jo': '1 John', '2Jo': '2 John', '3Jo': '3 John', 'Jde': 'Jude', 'Rev': 'Revelation'
+}
+
+# Patterns used by ErrorDetectionEngine on every verse, compiled once
+_RE_DIGIT = re.compile(r'\d')
+_RE_DIGITS = re.compile(r'\d+')
+_RE_MARKUP = re.compile(r'<[^>]+>|&[a-zA-Z]+;')
+_RE_WORD = re.compile(r'\w+')
+
+# Characters allowed in verse text: letters, whitespace and punctuation
+# (including curly quotes). Translating with _STRIP_VALID_CHARS leaves only
+# the invalid characters, in one pass instead of a regex match per character.
+_VALID_CHARS = (
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    ".,;:!?'\"()[]/-–—\u201c\u201d\u2018\u2019…"
+    + ''.join(c for c in map(chr, range(0x3001)) if c.isspace())
+)
+_STRIP_VALID_CHARS = str.maketrans('', '', _VALID_CHARS)
+
+# Deletes ASCII, leaving the characters the encoding check has to look up
+_STRIP_ASCII = dict.fromkeys(range(128))
+
+# Whether a non-ASCII character is in a control category (C*), memoised
+# per character: a translation repeats the same few non-ASCII characters,
+# so unicodedata.category runs once for each. Seeded with Latin-1.
+_IS_CONTROL_CHAR = {chr(i): unicodedata.category(chr(i)).startswith('C') for i in range(128, 256)}
+
+# ENCODING_PROBLEMS lists at most this many characters
+_MAX_UNUSUAL_CHARS = 5
+
+def verse_text_hash(text: str) -> bytes:
+    """64-bit BLAKE2b digest of a verse's stripped, lower-cased text
+    
+    Stored in bible_verses.text_hash, so duplicate detection reads it back
+    instead of rehashing every verse on every scan. A stable digest, unlike
+    hash(), which is salted per process. Digests are only compared within
+    one translation (about 31,000 verses), where the chance of any two
+    distinct verses colliding in 64 bits is below 1 in 10^10.
+    """
+    return hashlib.blake2b(text.strip().lower().encode('utf-8'), digest_size=8).digest()
+
+
+def parse_bible_json(json_path: Path, translation_abbrev: str = None,
+                     progress_callback=None) -> Dict[str, Any]:
+    """Parse a JSON Bible file into bible_verses rows
+    
+    Touches no database state, so it can run in a worker process; the
+    result is passed to BibleDatabaseManager.store_parsed_bible.
+    """
+    try:
+        bible_data = json_loads(Path(json_path).read_bytes())
+    except Exception as e:
+        raise Exception(f"Failed to load JSON file: {e}")
+    
+    # Extract translation info
+    trans_info = bible_data.get('translation_info', {})
+    abbrev = translation_abbrev or trans_info.get('abbrev', Path(json_path).stem.upper())
+    full_name = trans_info.get('name', f"{abbrev} Translation")
+    
+    books = bible_data.get('books', {})
+    verse_data = []
+    # Every row shares one timestamp, formatted the way sqlite3 stores a datetime
+    imported = datetime.now().isoformat(" ")
+    for book_abbrev, book_data in books.items():
+        book_name = BOOK_NAMES.get(book_abbrev, book_data.get('name', book_abbrev))
+        chapters = book_data.get('chapters', {})
+        
+        for chapter_str, verses in chapters.items():
+            try:
+                chapter_num = int(chapter_str)
+            except ValueError:
+                continue
+            
+            for verse_str, verse_text in verses.items():
+                try:
+                    verse_num = int(verse_str)
+                except ValueError:
+                    continue
+                
+                if isinstance(verse_text, str) and verse_text.strip():
+                    verse_data.append((
+                        abbrev, book_abbrev, book_name, chapter_num, 
+                        verse_num, verse_text, None, imported, None, False,
+                        verse_text_hash(verse_text)
+                    ))
+                    
+                    # Progress callback
+                    if progress_callback and len(verse_data) % 100 == 0:
+                        progress_callback(len(verse_data), "verses imported")
+    
+    return {
+        'source_file': str(json_path),
+        'translation': abbrev,
+        'full_name': full_name,
+        'books': len(books),
+        'verse_data': verse_data
+    }
+
 class BibleDatabaseManager:
     """Comprehensive database manager for Bible text correction system"""
     
+    # (child table, parent key) pairs whose rows are deleted with their parent
+    _CASCADING_FOREIGN_KEYS = (
+        ('bible_verses', 'translations(abbrev)'),
+        ('error_instances', 'bible_verses(id)'),
+    )
+    
+    # Error instances joined with their type and verse; filters are appended
+    _ERROR_INSTANCE_QUERY = """
+        SELECT ei.id, ei.verse_id, ei.error_type_id, ei.status, ei.error_text, 
+               ei.context, ei.line_reference, ei.detected_date, ei.resolved_date, 
+               ei.resolution_notes, et.error_code, et.description, et.severity,
+               bv.translation, bv.book, bv.chapter, bv.verse,
+               substr(ei.error_text, 1, 50) ||
+                   CASE WHEN length(ei.error_text) > 50 THEN '...' ELSE '' END AS error_text_short
+        FROM error_instances ei
+        JOIN error_types et ON ei.error_type_id = et.id
+        JOIN bible_verses bv ON ei.verse_id = bv.id
+        WHERE 1=1
+    """
+    
     def __init__(self, db_path: str = "bible_correction.db"):
         self.db_path = db_path
-        self.conn = None
+        self.fts_enabled = False
+        self._error_types_by_code = None
+        self._local = threading.local()
+        self._connections = []  # every thread's connection, for close()
+        self._connections_lock = threading.Lock()
         self.setup_database()
         self.setup_error_types()
     
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's database connection, opened on first use
+        
+        Each thread gets its own connection so a long scan or import on a
+        worker does not hold up queries from the Tk thread; WAL lets them
+        read while another connection writes.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection PRAGMAs applied"""
+        # Writers wait up to 30 s for one another instead of failing at once
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA synchronous = NORMAL")  # WAL stays consistent; skips fsync per commit
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -200000")  # up to ~200 MB of page cache
+        conn.execute("PRAGMA mmap_size = 268435456")  # read pages through a 256 MB memory map
+        return conn
+    
     def setup_database(self):
         """Initialize database connection and create all tables"""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.execute("PRAGMA foreign_keys = ON")
-        self.conn.execute("PRAGMA journal_mode = WAL")  # Better concurrency
+        self.conn.execute("PRAGMA journal_mode = WAL")  # Better concurrency; persists in the file
+        self._upgrade_cascading_deletes()
         
         # Create complete schema
         self.conn.executescript("""
@@ -101,7 +302,8 @@ class BibleDatabaseManager:
                 last_modified DATETIME DEFAULT CURRENT_TIMESTAMP,
                 correction_notes TEXT,
                 has_errors BOOLEAN DEFAULT 0,
-                FOREIGN KEY (translation) REFERENCES translations(abbrev),
+                text_hash BLOB, -- verse_text_hash(original_text)
+                FOREIGN KEY (translation) REFERENCES translations(abbrev) ON DELETE CASCADE,
                 UNIQUE(translation, book, chapter, verse)
             );
             
@@ -126,7 +328,7 @@ class BibleDatabaseManager:
                 detected_date DATETIME DEFAULT CURRENT_TIMESTAMP,
                 resolved_date DATETIME,
                 resolution_notes TEXT,
-                FOREIGN KEY (verse_id) REFERENCES bible_verses(id),
+                FOREIGN KEY (verse_id) REFERENCES bible_verses(id) ON DELETE CASCADE,
                 FOREIGN KEY (error_type_id) REFERENCES error_types(id)
             );
             
@@ -143,13 +345,113 @@ class BibleDatabaseManager:
             
             -- Create indexes for better performance
             CREATE INDEX IF NOT EXISTS idx_bible_verses_translation ON bible_verses(translation);
-            CREATE INDEX IF NOT EXISTS idx_bible_verses_book ON bible_verses(book);
+            -- Covering index: get_books aggregates without reading table rows
+            CREATE INDEX IF NOT EXISTS idx_bible_verses_books
+                ON bible_verses(translation, book, book_name, chapter, has_errors);
             CREATE INDEX IF NOT EXISTS idx_bible_verses_errors ON bible_verses(has_errors);
             CREATE INDEX IF NOT EXISTS idx_error_instances_verse ON error_instances(verse_id);
-            CREATE INDEX IF NOT EXISTS idx_error_instances_status ON error_instances(status);
+            CREATE INDEX IF NOT EXISTS idx_error_instances_filter ON error_instances(status, error_type_id);
             CREATE INDEX IF NOT EXISTS idx_error_instances_type ON error_instances(error_type_id);
+            CREATE INDEX IF NOT EXISTS idx_error_instances_detected ON error_instances(detected_date, id);
+            
+            -- Superseded by idx_error_instances_filter
+            DROP INDEX IF EXISTS idx_error_instances_status;
+            -- Book lookups always come with a translation; see idx_bible_verses_books
+            DROP INDEX IF EXISTS idx_bible_verses_book;
         """)
         self.conn.commit()
+        self._upgrade_text_hashes()
+        self._setup_verse_search()
+    
+    def _setup_verse_search(self):
+        """Create the trigram full-text index used by search_verses
+        
+        Bulk imports and deletes index or unindex a whole translation with one
+        statement (per-row triggers made imports roughly ten times slower);
+        single-verse text edits are picked up by a trigger. SQLite builds
+        without FTS5 or the trigram tokenizer (3.34+) keep the plain LIKE scan.
+        """
+        existed = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'verses_fts'"
+        ).fetchone() is not None
+        
+        try:
+            self.conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS verses_fts USING fts5(
+                    original_text, corrected_text,
+                    content='bible_verses', content_rowid='id', tokenize='trigram'
+                );
+                
+                CREATE TRIGGER IF NOT EXISTS bible_verses_fts_update
+                AFTER UPDATE OF original_text, corrected_text ON bible_verses BEGIN
+                    INSERT INTO verses_fts(verses_fts, rowid, original_text, corrected_text)
+                    VALUES ('delete', old.id, old.original_text, old.corrected_text);
+                    INSERT INTO verses_fts(rowid, original_text, corrected_text)
+                    VALUES (new.id, new.original_text, new.corrected_text);
+                END;
+            """)
+        except sqlite3.OperationalError as e:
+            logging.warning(f"Full-text verse search unavailable, using LIKE scans: {e}")
+            return
+        
+        if not existed:
+            # Index verses imported before the search table existed
+            self.conn.execute("INSERT INTO verses_fts(verses_fts) VALUES ('rebuild')")
+            self.conn.commit()
+        
+        self.fts_enabled = True
+    
+    def _index_translation_text(self, translation: str):
+        """Add a translation's verses to the full-text index"""
+        if self.fts_enabled:
+            self.conn.execute("""
+                INSERT INTO verses_fts(rowid, original_text, corrected_text)
+                SELECT id, original_text, corrected_text FROM bible_verses WHERE translation = ?
+            """, (translation,))
+    
+    def _unindex_translation_text(self, translation: str):
+        """Remove a translation's verses from the full-text index; call before deleting them"""
+        if self.fts_enabled:
+            self.conn.execute("""
+                INSERT INTO verses_fts(verses_fts, rowid, original_text, corrected_text)
+                SELECT 'delete', id, original_text, corrected_text FROM bible_verses WHERE translation = ?
+            """, (translation,))
+    
+    def _upgrade_cascading_deletes(self):
+        """Rebuild tables created before their foreign keys cascaded on delete
+        
+        SQLite cannot alter a constraint in place, so each stale table is
+        copied into a replacement built from its stored definition with
+        ON DELETE CASCADE added. Its indexes are recreated by setup_database.
+        """
+        stale = []
+        for table, parent in self._CASCADING_FOREIGN_KEYS:
+            parent_table = parent.split('(')[0]
+            foreign_keys = self.conn.execute(f"PRAGMA foreign_key_list({table})").fetchall()
+            if any(fk[2] == parent_table and fk[6] != 'CASCADE' for fk in foreign_keys):
+                stale.append((table, parent))
+        
+        if not stale:
+            return
+        
+        # Must be switched off outside a transaction
+        self.conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            self.conn.execute("BEGIN")
+            with self.conn:
+                for table, parent in stale:
+                    sql = self.conn.execute(
+                        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+                    ).fetchone()[0]
+                    sql = sql.replace(f"REFERENCES {parent}", f"REFERENCES {parent} ON DELETE CASCADE", 1)
+                    sql = sql.replace(table, f"{table}_new", 1)
+                    
+                    self.conn.execute(sql)
+                    self.conn.execute(f"INSERT INTO {table}_new SELECT * FROM {table}")
+                    self.conn.execute(f"DROP TABLE {table}")
+                    self.conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+        finally:
+            self.conn.execute("PRAGMA foreign_keys = ON")
     
     def setup_error_types(self):
         """Initialize predefined error types with fix suggestions"""
@@ -182,6 +484,8 @@ class BibleDatabaseManager:
              "Fix JSON structure"),
             ("DUPLICATE_CONTENT", "Identical verse content found", "WARNING", 
              "Verify if intentional duplication"),
+            ("NEAR_DUPLICATE_CONTENT", "Nearly identical verse content found", "INFO", 
+             "Verify if intentional parallel or copying error"),
             ("CAPITALIZATION_ISSUES", "Unusual capitalization patterns", "INFO", 
              "Review capitalization consistency"),
             ("NON_INTEGER_REFERENCE", "Non-integer verse/chapter numbers", "CRITICAL", 
@@ -194,109 +498,98 @@ class BibleDatabaseManager:
              "Fix formatting"),
         ]
         
-        for error_code, description, severity, fix_suggestion in error_types:
-            self.conn.execute(
+        with self.conn:
+            self.conn.executemany(
                 "INSERT OR IGNORE INTO error_types (error_code, description, severity, fix_suggestion) VALUES (?, ?, ?, ?)",
-                (error_code, description, severity, fix_suggestion)
+                error_types
             )
-        self.conn.commit()
+        self._error_types_by_code = None
+    
+    def _upgrade_text_hashes(self):
+        """Add and fill bible_verses.text_hash in databases created without it"""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(bible_verses)")]
+        with self.conn:
+            if 'text_hash' not in columns:
+                self.conn.execute("ALTER TABLE bible_verses ADD COLUMN text_hash BLOB")
+            # Created here rather than in setup_database's script, which runs
+            # before the column exists in older databases
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_bible_verses_hash
+                    ON bible_verses(translation, text_hash)
+            """)
+            
+            missing = self.conn.execute(
+                "SELECT id, original_text FROM bible_verses WHERE text_hash IS NULL"
+            ).fetchall()
+            if missing:
+                self.conn.executemany(
+                    "UPDATE bible_verses SET text_hash = ? WHERE id = ?",
+                    [(verse_text_hash(text or ""), verse_id) for verse_id, text in missing]
+                )
     
     def import_json_file(self, json_path: Path, translation_abbrev: str = None, 
                         progress_callback=None) -> Dict[str, int]:
         """Import JSON Bible file into database"""
-        try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                bible_data = json.load(f)
-        except Exception as e:
-            raise Exception(f"Failed to load JSON file: {e}")
-        
-        # Extract translation info
-        trans_info = bible_data.get('translation_info', {})
-        abbrev = translation_abbrev or trans_info.get('abbrev', json_path.stem.upper())
-        full_name = trans_info.get('name', f"{abbrev} Translation")
-        
-        # Insert/update translation record
-        self.conn.execute("""
-            INSERT OR REPLACE INTO translations (abbrev, full_name, source_file, imported_date)
-            VALUES (?, ?, ?, ?)
-        """, (abbrev, full_name, str(json_path), datetime.now()))
-        
-        # Clear existing verses for this translation
-        self.conn.execute("DELETE FROM bible_verses WHERE translation = ?", (abbrev,))
-        
-        # Import verses
-        books = bible_data.get('books', {})
-        total_verses = 0
-        
-        # Book name mapping
-        book_names = {
-            'Gen': 'Genesis', 'Exo': 'Exodus', 'Lev': 'Leviticus', 'Num': 'Numbers', 'Deu': 'Deuteronomy',
-            'Jos': 'Joshua', 'Jdg': 'Judges', 'Rut': 'Ruth', '1Sa': '1 Samuel', '2Sa': '2 Samuel',
-            '1Ki': '1 Kings', '2Ki': '2 Kings', '1Ch': '1 Chronicles', '2Ch': '2 Chronicles',
-            'Ezr': 'Ezra', 'Neh': 'Nehemiah', 'Est': 'Esther', 'Job': 'Job', 'Psa': 'Psalms',
-            'Pro': 'Proverbs', 'Ecc': 'Ecclesiastes', 'Son': 'Song of Songs', 'Isa': 'Isaiah',
-            'Jer': 'Jeremiah', 'Lam': 'Lamentations', 'Eze': 'Ezekiel', 'Dan': 'Daniel',
-            'Hos': 'Hosea', 'Joe': 'Joel', 'Amo': 'Amos', 'Oba': 'Obadiah', 'Jon': 'Jonah',
-            'Mic': 'Micah', 'Nah': 'Nahum', 'Hab': 'Habakkuk', 'Zep': 'Zephaniah', 'Hag': 'Haggai',
-            'Zec': 'Zechariah', 'Mal': 'Malachi', 'Mat': 'Matthew', 'Mar': 'Mark', 'Luk': 'Luke',
-            'Joh': 'John', 'Act': 'Acts', 'Rom': 'Romans', '1Co': '1 Corinthians', '2Co': '2 Corinthians',
-            'Gal': 'Galatians', 'Eph': 'Ephesians', 'Phi': 'Philippians', 'Col': 'Colossians',
-            '1Th': '1 Thessalonians', '2Th': '2 Thessalonians', '1Ti': '1 Timothy', '2Ti': '2 Timothy',
-            'Tit': 'Titus', 'Phm': 'Philemon', 'Heb': 'Hebrews', 'Jas': 'James', '1Pe': '1 Peter',
-            '2Pe': '2 Peter', '1Jo': '1 John', '2Jo': '2 John', '3Jo': '3 John', 'Jde': 'Jude', 'Rev': 'Revelation'
-        }
+        parsed = parse_bible_json(json_path, translation_abbrev, progress_callback)
+        return self.store_parsed_bible(parsed)
+    
+    def store_parsed_bible(self, parsed: Dict[str, Any]) -> Dict[str, int]:
+        """Replace a translation's verses with the output of parse_bible_json"""
+        abbrev = parsed['translation']
+        verse_data = parsed['verse_data']
+        total_verses = len(verse_data)
         
-        verse_data = []
-        for book_abbrev, book_data in books.items():
-            book_name = book_names.get(book_abbrev, book_data.get('name', book_abbrev))
-            chapters = book_data.get('chapters', {})
+        # One transaction per file: a failed import rolls back to the old verses
+        with self.conn:
+            # Take the write lock up front rather than upgrading mid-import,
+            # which can fail with SQLITE_BUSY while another process writes
+            self.conn.execute("BEGIN IMMEDIATE")
             
-            for chapter_str, verses in chapters.items():
-                try:
-                    chapter_num = int(chapter_str)
-                except ValueError:
-                    continue
-                
-                for verse_str, verse_text in verses.items():
-                    try:
-                        verse_num = int(verse_str)
-                    except ValueError:
-                        continue
-                    
-                    if isinstance(verse_text, str) and verse_text.strip():
-                        verse_data.append((
-                            abbrev, book_abbrev, book_name, chapter_num, 
-                            verse_num, verse_text, None, datetime.now(), None, False
-                        ))
-                        total_verses += 1
-                        
-                        # Progress callback
-                        if progress_callback and total_verses % 100 == 0:
-                            progress_callback(total_verses, "verses imported")
-        
-        # Bulk insert verses
-        if verse_data:
-            self.conn.executemany("""
-                INSERT INTO bible_verses 
-                (translation, book, book_name, chapter, verse, original_text, corrected_text, 
-                 last_modified, correction_notes, has_errors)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, verse_data)
-        
-        # Update translation statistics
-        self.conn.execute(
-            "UPDATE translations SET total_verses = ? WHERE abbrev = ?", 
-            (total_verses, abbrev)
-        )
-        
-        self.conn.commit()
+            # Drop the old verses from the search index while they still exist;
+            # replacing the translation row cascades to them
+            self._unindex_translation_text(abbrev)
+            
+            # Insert/update translation record
+            self.conn.execute("""
+                INSERT OR REPLACE INTO translations (abbrev, full_name, source_file, imported_date)
+                VALUES (?, ?, ?, ?)
+            """, (abbrev, parsed['full_name'], parsed['source_file'], datetime.now()))
+            
+            # Clear existing verses for this translation
+            self.conn.execute("DELETE FROM bible_verses WHERE translation = ?", (abbrev,))
+            
+            # Bulk insert verses
+            if verse_data:
+                self.conn.executemany("""
+                    INSERT INTO bible_verses 
+                    (translation, book, book_name, chapter, verse, original_text, corrected_text, 
+                     last_modified, correction_notes, has_errors, text_hash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, verse_data)
+                self._index_translation_text(abbrev)
+            
+            # Update translation statistics
+            self.conn.execute(
+                "UPDATE translations SET total_verses = ? WHERE abbrev = ?", 
+                (total_verses, abbrev)
+            )
         
         return {
             'translation': abbrev,
             'total_verses': total_verses,
-            'books': len(books)
+            'books': parsed['books']
         }
     
+    def optimize(self):
+        """Refresh the query planner's statistics; call once after a batch of imports or scans
+        
+        PRAGMA optimize only analyzes tables this thread's connection used
+        whose statistics are missing or out of date, so call it from the
+        thread that did the batch's writes.
+        """
+        self.conn.execute("PRAGMA optimize")
+        self.conn.commit()
+    
     def get_translations(self) -> List[Dict]:
         """Get all translations with statistics"""
         cursor = self.conn.execute("""
@@ -310,8 +603,21 @@ class BibleDatabaseManager:
     
     def get_verses(self, translation: str = None, book: str = None, 
                    chapter: int = None, has_errors: bool = None, 
-                   limit: int = None, offset: int = 0) -> List[VerseData]:
+                   limit: int = None, offset: int = 0,
+                   parse_dates: bool = True) -> List[VerseData]:
         """Get verses with optional filtering"""
+        return list(self.iter_verses(translation, book, chapter, has_errors, limit, offset,
+                                     parse_dates))
+    
+    def iter_verses(self, translation: str = None, book: str = None, 
+                    chapter: int = None, has_errors: bool = None, 
+                    limit: int = None, offset: int = 0,
+                    parse_dates: bool = True) -> Iterator[VerseData]:
+        """Yield verses with optional filtering, one row at a time
+        
+        With parse_dates=False last_modified is left as the stored string,
+        sparing a datetime parse per row for callers that never read it.
+        """
         query = """
             SELECT id, translation, book, book_name, chapter, verse, 
                    original_text, corrected_text, last_modified, correction_notes, has_errors
@@ -339,27 +645,60 @@ class BibleDatabaseManager:
         query += " ORDER BY translation, book, chapter, verse"
         
         if limit:
-            query += f" LIMIT {limit} OFFSET {offset}"
+            query += " LIMIT ? OFFSET ?"
+            params.extend((limit, offset))
         
         cursor = self.conn.execute(query, params)
-        verses = []
-        
-        for row in cursor.fetchall():
-            verses.append(VerseData(
-                id=row[0],
-                translation=row[1],
-                book=row[2],
-                book_name=row[3],
-                chapter=row[4],
-                verse=row[5],
-                original_text=row[6],
-                corrected_text=row[7],
-                last_modified=datetime.fromisoformat(row[8]) if row[8] else None,
-                correction_notes=row[9],
-                has_errors=bool(row[10])
-            ))
-        
-        return verses
+        for row in cursor:
+            yield self._verse_from_row(row, parse_dates)
+    
+    def count_verses(self, translation: str) -> int:
+        """Count the verses of a translation"""
+        cursor = self.conn.execute(
+            "SELECT COUNT(*) FROM bible_verses WHERE translation = ?", (translation,)
+        )
+        return cursor.fetchone()[0]
+    
+    def iter_verse_texts(self, translation: str) -> Iterator[Tuple[int, str, int, int, str, bytes]]:
+        """Yield (id, book, chapter, verse, original_text, text_hash) for a translation's verses
+        
+        Streamed from the cursor without building VerseData objects, for
+        passes that only read the original text.
+        """
+        cursor = self.conn.execute("""
+            SELECT id, book, chapter, verse, original_text, text_hash
+            FROM bible_verses
+            WHERE translation = ?
+            ORDER BY book, chapter, verse
+        """, (translation,))
+        yield from cursor
+    
+    def get_verse_by_id(self, verse_id: int) -> Optional[VerseData]:
+        """Get a single verse by its primary key"""
+        cursor = self.conn.execute("""
+            SELECT id, translation, book, book_name, chapter, verse, 
+                   original_text, corrected_text, last_modified, correction_notes, has_errors
+            FROM bible_verses
+            WHERE id = ?
+        """, (verse_id,))
+        row = cursor.fetchone()
+        return self._verse_from_row(row) if row else None
+    
+    def _verse_from_row(self, row: tuple, parse_dates: bool = True) -> VerseData:
+        """Build a VerseData from a bible_verses row"""
+        return VerseData(
+            id=row[0],
+            translation=row[1],
+            book=row[2],
+            book_name=row[3],
+            chapter=row[4],
+            verse=row[5],
+            original_text=row[6],
+            corrected_text=row[7],
+            last_modified=datetime.fromisoformat(row[8]) if parse_dates and row[8] else row[8],
+            correction_notes=row[9],
+            has_errors=bool(row[10])
+        )
     
     def update_verse(self, verse_id: int, corrected_text: str, 
                     correction_notes: str = None) -> bool:
@@ -377,6 +716,50 @@ class BibleDatabaseManager:
             logging.error(f"Failed to update verse {verse_id}: {e}")
             return False
     
+    def collapse_multiple_spaces(self) -> int:
+        """Replace runs of spaces in every verse's current text with one space
+        
+        Each pass halves every run, so a few set-based UPDATEs cover any
+        run length. Returns the number of verses changed.
+        """
+        collapse = """
+            UPDATE bible_verses
+            SET corrected_text = REPLACE(COALESCE(corrected_text, original_text), '  ', ' '),
+                last_modified = ?
+            WHERE COALESCE(corrected_text, original_text) LIKE '%  %'
+        """
+        now = datetime.now()
+        
+        # Every affected verse is touched by the first pass
+        with self.conn:
+            changed = self.conn.execute(collapse, (now,)).rowcount
+            while self.conn.execute(collapse, (now,)).rowcount:
+                pass
+        return changed
+    
+    def trim_verse_whitespace(self) -> int:
+        """Strip leading/trailing whitespace from every verse's current text
+        
+        Returns the number of verses changed.
+        """
+        with self.conn:
+            return self.conn.execute("""
+                UPDATE bible_verses
+                SET corrected_text = TRIM(COALESCE(corrected_text, original_text), ' ' || char(9, 10, 13)),
+                    last_modified = ?
+                WHERE COALESCE(corrected_text, original_text)
+                      != TRIM(COALESCE(corrected_text, original_text), ' ' || char(9, 10, 13))
+            """, (datetime.now(),)).rowcount
+    
+    def reset_corrections(self) -> int:
+        """Discard every verse correction; returns the number of verses reset"""
+        with self.conn:
+            return self.conn.execute("""
+                UPDATE bible_verses
+                SET corrected_text = NULL, correction_notes = NULL, last_modified = ?
+                WHERE corrected_text IS NOT NULL OR correction_notes IS NOT NULL
+            """, (datetime.now(),)).rowcount
+    
     def get_error_types(self) -> List[Dict]:
         """Get all error types"""
         cursor = self.conn.execute("""
@@ -388,6 +771,12 @@ class BibleDatabaseManager:
         columns = [desc[0] for desc in cursor.description]
         return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
+    def get_error_types_by_code(self) -> Dict[str, Dict]:
+        """Get error types keyed by error code (cached until types change)"""
+        if self._error_types_by_code is None:
+            self._error_types_by_code = {et['error_code']: et for et in self.get_error_types()}
+        return self._error_types_by_code
+    
     def add_error_instance(self, verse_id: int, error_type_id: int, 
                           error_text: str, context: str, line_reference: str) -> int:
         """Add a new error instance"""
@@ -397,27 +786,50 @@ class BibleDatabaseManager:
             VALUES (?, ?, ?, ?, ?, ?)
         """, (verse_id, error_type_id, error_text, context, line_reference, datetime.now()))
         
-        # Mark verse as having errors
+        # Mark verse as having errors; a verse already flagged is not rewritten
         self.conn.execute(
-            "UPDATE bible_verses SET has_errors = 1 WHERE id = ?", (verse_id,)
+            "UPDATE bible_verses SET has_errors = 1 WHERE id = ? AND NOT has_errors", (verse_id,)
         )
         
         self.conn.commit()
         return cursor.lastrowid
     
+    def replace_translation_errors(self, translation: str, errors: List[Tuple[int, int, str, str, str]]):
+        """Replace all error instances of a translation in one transaction
+        
+        errors holds (verse_id, error_type_id, error_text, context, line_reference)
+        tuples; the verses they name are flagged has_errors and all others cleared.
+        """
+        now = datetime.now()
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM error_instances WHERE verse_id IN (SELECT id FROM bible_verses WHERE translation = ?)",
+                (translation,)
+            )
+            self.conn.execute("UPDATE bible_verses SET has_errors = 0 WHERE translation = ?", (translation,))
+            self.conn.executemany("""
+                INSERT INTO error_instances 
+                (verse_id, error_type_id, error_text, context, line_reference, detected_date)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [error + (now,) for error in errors])
+            self.conn.executemany(
+                "UPDATE bible_verses SET has_errors = 1 WHERE id = ?",
+                [(verse_id,) for verse_id in {error[0] for error in errors}]
+            )
+    
     def get_error_instances(self, verse_id: int = None, status: str = None, 
-                           error_type_id: int = None) -> List[Dict]:
-        """Get error instances with optional filtering"""
-        query = """
-            SELECT ei.id, ei.verse_id, ei.error_type_id, ei.status, ei.error_text, 
-                   ei.context, ei.line_reference, ei.detected_date, ei.resolved_date, 
-                   ei.resolution_notes, et.error_code, et.description, et.severity,
-                   bv.translation, bv.book, bv.chapter, bv.verse
-            FROM error_instances ei
-            JOIN error_types et ON ei.error_type_id = et.id
-            JOIN bible_verses bv ON ei.verse_id = bv.id
-            WHERE 1=1
+                           error_type_id: int = None, limit: int = None,
+                           offset: int = 0, before: Tuple[str, int] = None) -> List[sqlite3.Row]:
+        """Get error instances with optional filtering, newest first
+        
+        before is the (detected_date, id) of the last row of the previous
+        page; rows after it are read straight from idx_error_instances_detected,
+        so every page costs the same, unlike a growing offset.
+        
+        Rows are sqlite3.Row objects: indexable by column name like a dict,
+        but built in C without a per-row dict.
         """
+        query = self._ERROR_INSTANCE_QUERY
         params = []
         
         if verse_id:
@@ -432,11 +844,45 @@ class BibleDatabaseManager:
             query += " AND ei.error_type_id = ?"
             params.append(error_type_id)
         
-        query += " ORDER BY ei.detected_date DESC"
+        if before:
+            query += " AND (ei.detected_date, ei.id) < (?, ?)"
+            params.extend(before)
+        
+        # id breaks ties (a scan stores all its errors with one date) so pages are stable
+        query += " ORDER BY ei.detected_date DESC, ei.id DESC"
+        
+        # Bound rather than inlined, so every page reuses the same cached
+        # prepared statement instead of compiling a new one
+        if limit:
+            query += " LIMIT ? OFFSET ?"
+            params.extend((limit, offset))
         
         cursor = self.conn.execute(query, params)
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        cursor.row_factory = sqlite3.Row
+        return cursor.fetchall()
+    
+    def iter_error_report_rows(self) -> Iterator[tuple]:
+        """Yield every error instance as an error report row, streamed from the cursor
+        
+        Columns: id, translation, book, chapter, verse, error code, severity,
+        status, error text, context, detected, resolved, resolution notes.
+        """
+        cursor = self.conn.execute("""
+            SELECT ei.id, bv.translation, bv.book, bv.chapter, bv.verse,
+                   et.error_code, et.severity, ei.status, ei.error_text, ei.context,
+                   ei.detected_date, ei.resolved_date, ei.resolution_notes
+            FROM error_instances ei
+            JOIN error_types et ON ei.error_type_id = et.id
+            JOIN bible_verses bv ON ei.verse_id = bv.id
+            ORDER BY ei.detected_date DESC, ei.id DESC
+        """)
+        yield from cursor
+    
+    def get_error_by_id(self, error_id: int) -> Optional[sqlite3.Row]:
+        """Get a single error instance by its primary key"""
+        cursor = self.conn.execute(self._ERROR_INSTANCE_QUERY + " AND ei.id = ?", (error_id,))
+        cursor.row_factory = sqlite3.Row
+        return cursor.fetchone()
     
     def resolve_error(self, error_id: int, status: str, resolution_notes: str = None) -> bool:
         """Mark an error as resolved"""
@@ -453,55 +899,61 @@ class BibleDatabaseManager:
             logging.error(f"Failed to resolve error {error_id}: {e}")
             return False
     
+    def bulk_set_error_status(self, status: str, from_status: str = 'open',
+                              error_code: str = None, resolution_notes: str = None) -> int:
+        """Move every error in from_status (optionally of one type) to status
+        
+        Returns the number of errors changed.
+        """
+        resolved_date = None if status == 'open' else datetime.now()
+        query = """
+            UPDATE error_instances
+            SET status = ?, resolved_date = ?, resolution_notes = ?
+            WHERE status = ?
+        """
+        params = [status, resolved_date, resolution_notes, from_status]
+        
+        if error_code:
+            query += " AND error_type_id = (SELECT id FROM error_types WHERE error_code = ?)"
+            params.append(error_code)
+        
+        with self.conn:
+            changed = self.conn.execute(query, params).rowcount
+        self.update_error_statistics()
+        return changed
+    
     def update_error_statistics(self):
         """Update error statistics table"""
         # Clear existing statistics
         self.conn.execute("DELETE FROM error_statistics")
         
-        # Calculate new statistics
+        # Calculate new statistics in a single pass over error_instances
         self.conn.execute("""
             INSERT INTO error_statistics (error_type_id, total_count, open_count, fixed_count, ignored_count, last_updated)
             SELECT 
                 et.id,
-                COALESCE(total.cnt, 0),
-                COALESCE(open.cnt, 0),
-                COALESCE(fixed.cnt, 0),
-                COALESCE(ignored.cnt, 0),
+                COUNT(ei.id),
+                SUM(CASE WHEN ei.status = 'open' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN ei.status = 'fixed' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN ei.status = 'ignored' THEN 1 ELSE 0 END),
                 CURRENT_TIMESTAMP
             FROM error_types et
-            LEFT JOIN (
-                SELECT error_type_id, COUNT(*) as cnt 
-                FROM error_instances 
-                GROUP BY error_type_id
-            ) total ON et.id = total.error_type_id
-            LEFT JOIN (
-                SELECT error_type_id, COUNT(*) as cnt 
-                FROM error_instances 
-                WHERE status = 'open'
-                GROUP BY error_type_id
-            ) open ON et.id = open.error_type_id
-            LEFT JOIN (
-                SELECT error_type_id, COUNT(*) as cnt 
-                FROM error_instances 
-                WHERE status = 'fixed'
-                GROUP BY error_type_id
-            ) fixed ON et.id = fixed.error_type_id
-            LEFT JOIN (
-                SELECT error_type_id, COUNT(*) as cnt 
-                FROM error_instances 
-                WHERE status = 'ignored'
-                GROUP BY error_type_id
-            ) ignored ON et.id = ignored.error_type_id
+            LEFT JOIN error_instances ei ON ei.error_type_id = et.id
+            GROUP BY et.id
         """)
         
-        # Update translation error counts
+        # Update translation error counts, aggregating open errors once for
+        # all translations rather than once per translation
         self.conn.execute("""
-            UPDATE translations SET error_count = (
-                SELECT COUNT(DISTINCT ei.id)
+            WITH open_counts AS (
+                SELECT bv.translation AS abbrev, COUNT(*) AS cnt
                 FROM error_instances ei
                 JOIN bible_verses bv ON ei.verse_id = bv.id
-                WHERE bv.translation = translations.abbrev
-                AND ei.status = 'open'
+                WHERE ei.status = 'open'
+                GROUP BY bv.translation
+            )
+            UPDATE translations SET error_count = COALESCE(
+                (SELECT cnt FROM open_counts WHERE open_counts.abbrev = translations.abbrev), 0
             )
         """)
         
@@ -523,6 +975,23 @@ class BibleDatabaseManager:
         columns = [desc[0] for desc in cursor.description]
         return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
+    def get_dashboard_snapshot(self, error_limit: int = None, error_status: str = None,
+                               error_type_id: int = None) -> Dict[str, List[Dict]]:
+        """Get translations, error statistics and the newest error instances in one call
+        
+        error_status and error_type_id filter the error instances as in
+        get_error_instances. The three reads share one read transaction, so a
+        scan committing on another connection cannot land between them.
+        """
+        self.conn.execute("BEGIN")
+        with self.conn:
+            return {
+                'translations': self.get_translations(),
+                'error_stats': self.get_error_statistics(),
+                'recent_errors': self.get_error_instances(status=error_status, error_type_id=error_type_id,
+                                                          limit=error_limit)
+            }
+    
     def search_verses(self, search_text: str, translation: str = None, 
                      search_corrected: bool = False, limit: int = 100) -> List[Dict]:
         """Search for verses containing specific text"""
@@ -530,17 +999,26 @@ class BibleDatabaseManager:
         
         query = f"""
             SELECT id, translation, book, book_name, chapter, verse, 
-                   original_text, corrected_text, has_errors
+                   original_text, corrected_text, has_errors,
+                   substr(original_text, 1, 100) ||
+                       CASE WHEN length(original_text) > 100 THEN '...' ELSE '' END AS original_text_short
             FROM bible_verses
             WHERE {text_field} LIKE ? COLLATE NOCASE
         """
         params = [f"%{search_text}%"]
         
+        if self.fts_enabled and len(search_text) >= 3:
+            # The trigram index narrows the candidates (it needs at least one
+            # trigram); the LIKE above keeps the exact matching rules
+            query += f" AND id IN (SELECT rowid FROM verses_fts WHERE {text_field} LIKE ?)"
+            params.append(f"%{search_text}%")
+        
         if translation:
             query += " AND translation = ?"
             params.append(translation)
         
-        query += f" ORDER BY translation, book, chapter, verse LIMIT {limit}"
+        query += " ORDER BY translation, book, chapter, verse LIMIT ?"
+        params.append(limit)
         
         cursor = self.conn.execute(query, params)
         columns = [desc[0] for desc in cursor.description]
@@ -557,8 +1035,16 @@ class BibleDatabaseManager:
         if not trans_row:
             raise ValueError(f"Translation {translation} not found")
         
-        # Get all verses
-        verses = self.get_verses(translation=translation)
+        # Blank corrections fall back to the original text
+        text_field = "COALESCE(NULLIF(corrected_text, ''), original_text)" if use_corrected else "original_text"
+        
+        # Stream just the exported columns rather than building VerseData objects
+        cursor = self.conn.execute(f"""
+            SELECT book, book_name, chapter, verse, {text_field}
+            FROM bible_verses
+            WHERE translation = ?
+            ORDER BY book, chapter, verse
+        """, (translation,))
         
         # Organize into JSON structure
         result = {
@@ -569,23 +1055,19 @@ class BibleDatabaseManager:
             "books": {}
         }
         
-        for verse in verses:
-            text = verse.corrected_text if (use_corrected and verse.corrected_text) else verse.original_text
+        # Rows arrive grouped by book and chapter, so each book and chapter
+        # dict is created once and then filled in place
+        current_book = current_chapter = None
+        for book, book_name, chapter, verse, text in cursor:
+            if book != current_book:
+                current_book, current_chapter = book, None
+                chapters = result["books"].setdefault(book, {"name": book_name, "chapters": {}})["chapters"]
             
-            # Initialize book if needed
-            if verse.book not in result["books"]:
-                result["books"][verse.book] = {
-                    "name": verse.book_name,
-                    "chapters": {}
-                }
+            if chapter != current_chapter:
+                current_chapter = chapter
+                chapter_verses = chapters.setdefault(str(chapter), {})
             
-            # Initialize chapter if needed
-            chapter_str = str(verse.chapter)
-            if chapter_str not in result["books"][verse.book]["chapters"]:
-                result["books"][verse.book]["chapters"][chapter_str] = {}
-            
-            # Add verse
-            result["books"][verse.book]["chapters"][chapter_str][str(verse.verse)] = text
+            chapter_verses[str(verse)] = text
         
         return result
     
@@ -618,138 +1100,352 @@ class BibleDatabaseManager:
         columns = [desc[0] for desc in cursor.description]
         return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
+    def delete_translation(self, translation: str):
+        """Delete a translation with its verses and their errors in one transaction"""
+        with self.conn:
+            # Verses and their error instances go with it via ON DELETE CASCADE
+            self._unindex_translation_text(translation)
+            self.conn.execute("DELETE FROM translations WHERE abbrev = ?", (translation,))
+        self.update_error_statistics()
+    
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Close every thread's database connection"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+class VerseDedupTracker:
+    """Remembers the verses of one scan to find exact and near duplicates
+    
+    Exact duplicates are matched on verse_text_hash digests. With
+    near_duplicates, verses that only differ slightly (punctuation, case,
+    a word or two) are also found with MinHash LSH over word 5-grams;
+    that needs datasketch.
+    """
+    
+    SHINGLE_SIZE = 5
+    NUM_PERM = 64
+    NEAR_DUPLICATE_THRESHOLD = 0.85  # estimated Jaccard similarity
+    PARALLEL_CHUNK_SIZE = 2000  # verses per worker task in minhash_all
+    
+    _empty_minhash = None  # created once per process by minhash()
+    
+    def __init__(self, near_duplicates: bool = False):
+        self._digests = {}  # text hash -> location of the first verse with it
+        self._locations = []  # LSH keys index this list, in scan order
+        self._lsh = None
+        if near_duplicates:
+            self._lsh = MinHashLSH(threshold=self.NEAR_DUPLICATE_THRESHOLD, num_perm=self.NUM_PERM)
+    
+    @classmethod
+    def minhash(cls, normalized_text: str) -> Optional['MinHash']:
+        """MinHash of a verse's word 5-grams; None if it has too few words"""
+        words = _RE_WORD.findall(normalized_text)
+        if len(words) < cls.SHINGLE_SIZE:
+            return None
+        
+        if cls._empty_minhash is None:
+            # Copying an empty MinHash reuses its permutations, which are
+            # costly to generate for every verse
+            cls._empty_minhash = MinHash(num_perm=cls.NUM_PERM)
+        minhash = cls._empty_minhash.copy()
+        minhash.update_batch([
+            ' '.join(words[i:i + cls.SHINGLE_SIZE]).encode('utf-8')
+            for i in range(len(words) - cls.SHINGLE_SIZE + 1)
+        ])
+        return minhash
+    
+    @classmethod
+    def minhash_all(cls, normalized_texts: List[str]) -> List[Optional['MinHash']]:
+        """MinHash a batch of verses
+        
+        Touches no tracker state, so it can run in a worker process; the
+        results are passed to check() in scan order.
+        """
+        return [cls.minhash(text) for text in normalized_texts]
+    
+    def check(self, location: str, normalized_text: str,
+              digest: bytes = None, minhash: 'MinHash' = None) -> Optional[Tuple[str, str]]:
+        """Record a verse; return (error_code, earlier location) if it repeats one
+        
+        digest is the verse's stored text_hash and minhash its precomputed
+        MinHash; each is computed when not given.
+        """
+        if digest is None:
+            digest = verse_text_hash(normalized_text)
+        original_location = self._digests.get(digest)
+        if original_location is not None:
+            return "DUPLICATE_CONTENT", original_location
+        self._digests[digest] = location
+        
+        if self._lsh is None:
+            return None
+        
+        if minhash is None:
+            minhash = self.minhash(normalized_text)
+            if minhash is None:
+                return None
+        matches = self._lsh.query(minhash)
+        
+        self._lsh.insert(len(self._locations), minhash)
+        self._locations.append(location)
+        
+        if matches:
+            return "NEAR_DUPLICATE_CONTENT", self._locations[min(matches)]
+        return None
 
 class ErrorDetectionEngine:
-    """Advanced error detection engine for Bible text"""
+    """Advanced error detection engine for Bible text
     
-    def __init__(self, db_manager: BibleDatabaseManager):
+    near_duplicates turns on NEAR_DUPLICATE_CONTENT detection, which needs
+    datasketch and makes scans markedly slower; it is off unless asked for.
+    """
+    
+    def __init__(self, db_manager: BibleDatabaseManager, near_duplicates: bool = False):
+        if near_duplicates and not DATASKETCH_AVAILABLE:
+            raise RuntimeError("Near-duplicate detection requires the datasketch package")
+        
         self.db = db_manager
-        self.error_types = {et['error_code']: et['id'] for et in db_manager.get_error_types()}
+        self.near_duplicates = near_duplicates
+        error_types = db_manager.get_error_types_by_code().values()
+        self.error_types = {et['error_code']: et['id'] for et in error_types}
+        self.severities = {et['id']: et['severity'] for et in error_types}
     
     def scan_translation(self, translation: str, progress_callback=None) -> Dict[str, int]:
         """Scan a translation for errors and store them in database"""
-        # Clear existing errors for this translation
-        verse_ids = [v.id for v in self.db.get_verses(translation=translation)]
-        if verse_ids:
-            placeholders = ','.join('?' * len(verse_ids))
-            self.db.conn.execute(f"DELETE FROM error_instances WHERE verse_id IN ({placeholders})", verse_ids)
-            self.db.conn.execute("UPDATE bible_verses SET has_errors = 0 WHERE translation = ?", (translation,))
-            self.db.conn.commit()
-        
-        # Get all verses for this translation
-        verses = self.db.get_verses(translation=translation)
-        total_verses = len(verses)
-        error_count = 0
-        verse_hashes = {}  # For duplicate detection
-        
-        for i, verse in enumerate(verses):
+        total_verses = self.db.count_verses(translation)
+        found_errors = []  # rows for replace_translation_errors
+        dedup = VerseDedupTracker(self.near_duplicates)  # For duplicate detection
+        
+        # Stream the verses; errors are only written once the cursor is exhausted
+        verses = self.db.iter_verse_texts(translation)
+        size = VerseDedupTracker.PARALLEL_CHUNK_SIZE
+        workers = min(os.cpu_count() or 1, -(-total_verses // size))
+        if self.near_duplicates and workers > 1:
+            # MinHashing is most of a scan's work and each verse's is
+            # independent, so it is spread over processes; the rule checks
+            # and the LSH lookups, which depend on scan order, stay here
+            verses_with_minhashes = self._parallel_minhashes(verses, workers)
+        else:
+            verses_with_minhashes = zip(verses, itertools.repeat(None))
+        
+        for i, ((verse_id, book, chapter, verse, text, text_hash), minhash) in enumerate(
+                verses_with_minhashes):
+            location = f"{book} {chapter}:{verse}"
             if progress_callback and i % 100 == 0:
-                progress_callback(i, total_verses, f"Scanning {verse.book} {verse.chapter}:{verse.verse}")
+                progress_callback(i, total_verses, f"Scanning {location}")
             
             # Detect errors in this verse
-            errors = self._detect_verse_errors(verse, verse_hashes)
+            errors = self._detect_verse_errors(location, text, dedup, text_hash, minhash)
             
             for error_code, error_text, context in errors:
                 if error_code in self.error_types:
-                    line_ref = f"{translation} {verse.book} {verse.chapter}:{verse.verse}"
-                    self.db.add_error_instance(
-                        verse.id, self.error_types[error_code], 
-                        error_text, context, line_ref
-                    )
-                    error_count += 1
+                    line_ref = f"{translation} {location}"
+                    found_errors.append((verse_id, self.error_types[error_code], 
+                                         error_text, context, line_ref))
+        
+        # Swap the old errors for the new ones in a single transaction
+        self.db.replace_translation_errors(translation, found_errors)
         
         # Update statistics
         self.db.update_error_statistics()
         
         return {
             'total_verses': total_verses,
-            'errors_found': error_count
+            'errors_found': len(found_errors),
+            'severity_counts': Counter(self.severities[error[1]] for error in found_errors)
         }
     
-    def _detect_verse_errors(self, verse: VerseData, verse_hashes: Dict) -> List[Tuple[str, str, str]]:
-        """Detect errors in a single verse"""
+    def _parallel_minhashes(self, verses: Iterator[tuple],
+                            workers: int) -> Iterator[Tuple[tuple, Optional['MinHash']]]:
+        """Pair each iter_verse_texts row with its MinHash, computed in worker processes
+        
+        Rows are read from the cursor PARALLEL_CHUNK_SIZE at a time with at
+        most two chunks per worker in flight, so memory stays bounded however
+        large the translation. Workers are spawned rather than forked: the
+        GUI scans on a thread, and a fork could copy a lock another thread
+        holds into the children.
+        """
+        size = VerseDedupTracker.PARALLEL_CHUNK_SIZE
+        chunks = iter(lambda: list(itertools.islice(verses, size)), [])
+        in_flight = deque()  # (rows, future of their MinHashes), in scan order
+        
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            for rows in chunks:
+                texts = [(row[4] or "").strip().lower() for row in rows]
+                in_flight.append((rows, pool.submit(VerseDedupTracker.minhash_all, texts)))
+                if len(in_flight) > 2 * workers:
+                    rows, future = in_flight.popleft()
+                    yield from zip(rows, future.result())
+            
+            while in_flight:
+                rows, future = in_flight.popleft()
+                yield from zip(rows, future.result())
+    
+    def _detect_verse_errors(self, location: str, text: str,
+                             dedup: VerseDedupTracker,
+                             text_hash: bytes = None,
+                             minhash: 'MinHash' = None) -> List[Tuple[str, str, str]]:
+        """Detect errors in the text of the verse at location ("Gen 1:1")
+        
+        text_hash and minhash are the verse's stored verse_text_hash and
+        precomputed MinHash, if already known.
+        """
         errors = []
-        text = verse.original_text
+        stripped = text.strip() if text else ""
         
-        if not text or not text.strip():
+        if not stripped:
             errors.append(("EMPTY_CONTENT", "Empty verse text", ""))
             return errors
         
-        context = f"{verse.book} {verse.chapter}:{verse.verse}: {text[:100]}..."
+        # One translate pass leaves only the characters outside _VALID_CHARS.
+        # Digits and markup characters are among them, so the digit and
+        # markup regexes only need to run on verses that have any.
+        invalid_chars = text.translate(_STRIP_VALID_CHARS)
         
         # Check for numbers in text
-        if re.search(r'\d', text):
-            numbers = re.findall(r'\d+', text)
-            errors.append(("NUMBERS_IN_TEXT", f"Contains numbers: {numbers}", context))
+        if invalid_chars and _RE_DIGIT.search(invalid_chars):
+            numbers = _RE_DIGITS.findall(text)
+            errors.append(("NUMBERS_IN_TEXT", f"Contains numbers: {numbers}"))
         
         # Check for invalid characters
-        if not re.match(r'^[a-zA-Z\s\.,;:!?\'"()\[\]\/\-–—""''…]*$', text):
-            invalid_chars = set(char for char in text 
-                              if not re.match(r'[a-zA-Z\s\.,;:!?\'"()\[\]\/\-–—""''…]', char))
-            errors.append(("INVALID_CHARS", f"Invalid characters: {list(invalid_chars)}", context))
+        if invalid_chars:
+            errors.append(("INVALID_CHARS", f"Invalid characters: {list(set(invalid_chars))}"))
         
         # Check for multiple spaces
-        if re.search(r'  +', text):
-            errors.append(("MULTIPLE_SPACES", "Multiple consecutive spaces found", context))
+        if '  ' in text:
+            errors.append(("MULTIPLE_SPACES", "Multiple consecutive spaces found"))
         
         # Check verse length
         if len(text) < 3:
-            errors.append(("VERSE_TOO_SHORT", f"Very short verse ({len(text)} chars)", context))
+            errors.append(("VERSE_TOO_SHORT", f"Very short verse ({len(text)} chars)"))
         elif len(text) > 500:
-            errors.append(("VERSE_TOO_LONG", f"Very long verse ({len(text)} chars)", context))
+            errors.append(("VERSE_TOO_LONG", f"Very long verse ({len(text)} chars)"))
         
         # Check for HTML/XML remnants
-        if re.search(r'<[^>]+>|&[a-zA-Z]+;', text):
-            errors.append(("HTML_XML_REMNANTS", "HTML/XML tags or entities found", context))
+        if invalid_chars and _RE_MARKUP.search(text):
+            errors.append(("HTML_XML_REMNANTS", "HTML/XML tags or entities found"))
         
         # Check for whitespace issues
-        if text != text.strip():
-            errors.append(("WHITESPACE_ISSUES", "Leading or trailing whitespace", context))
+        if len(stripped) != len(text):
+            errors.append(("WHITESPACE_ISSUES", "Leading or trailing whitespace"))
         
         # Check for encoding problems
         unusual_chars = []
-        for char in text:
-            if ord(char) > 127:
-                category = unicodedata.category(char)
-                if category.startswith('C'):  # Control characters
+        if not text.isascii():
+            for char in text.translate(_STRIP_ASCII):
+                is_control = _IS_CONTROL_CHAR.get(char)
+                if is_control is None:
+                    is_control = _IS_CONTROL_CHAR[char] = unicodedata.category(char).startswith('C')
+                
+                if is_control:
                     unusual_chars.append(char)
+                    if len(unusual_chars) == _MAX_UNUSUAL_CHARS:
+                        break
         
         if unusual_chars:
-            errors.append(("ENCODING_PROBLEMS", f"Unusual characters: {unusual_chars[:5]}", context))
+            errors.append(("ENCODING_PROBLEMS", f"Unusual characters: {unusual_chars}"))
         
         # Check for duplicate content
-        if len(text.strip()) > 10:  # Skip very short verses
-            text_hash = hash(text.strip().lower())
-            location = f"{verse.book} {verse.chapter}:{verse.verse}"
-            
-            if text_hash in verse_hashes:
-                original_location = verse_hashes[text_hash]
-                errors.append(("DUPLICATE_CONTENT", f"Identical to {original_location}", context))
-            else:
-                verse_hashes[text_hash] = location
+        if len(stripped) > 10:  # Skip very short verses
+            duplicate = dedup.check(location, stripped.lower(), text_hash, minhash)
+            if duplicate:
+                error_code, original_location = duplicate
+                if error_code == "DUPLICATE_CONTENT":
+                    errors.append((error_code, f"Identical to {original_location}"))
+                else:
+                    errors.append((error_code, f"Nearly identical to {original_location}"))
         
         # Check capitalization
         words = text.split()
         if len(words) > 2:
             all_caps_count = sum(1 for word in words if word.isupper() and len(word) > 1)
             if all_caps_count > len(words) * 0.3:  # More than 30% all caps
-                errors.append(("CAPITALIZATION_ISSUES", f"Many capitalized words ({all_caps_count}/{len(words)})", context))
+                errors.append(("CAPITALIZATION_ISSUES", f"Many capitalized words ({all_caps_count}/{len(words)})"))
+        
+        if not errors:
+            return errors
         
-        return errors
+        # Most verses are clean, so the context is only built once one has an error
+        context = f"{location}: {text[:100]}..."
+        return [(error_code, error_text, context) for error_code, error_text in errors]
+
+
+# Severities that fail a headless scan for each --fail-on level
+FAIL_ON_SEVERITIES = {
+    'error': ('CRITICAL',),
+    'warning': ('CRITICAL', 'WARNING'),
+}
+
+# Exit status of a completed headless scan that failed its --fail-on level;
+# distinct from 1, which an uncaught exception exits with
+FINDINGS_EXIT_STATUS = 3
+
+def run_headless_scan(db_manager: BibleDatabaseManager, translations: List[str] = None,
+                      near_duplicates: bool = False, fail_on: str = None) -> int:
+    """Scan translations (default: all) without the GUI; returns the exit status
+    
+    A completed scan returns 0 whatever it found, unless fail_on ('error' or
+    'warning', see FAIL_ON_SEVERITIES) is given and a finding of that
+    severity or worse was stored; then it returns FINDINGS_EXIT_STATUS.
+    """
+    if not translations:
+        translations = [t['abbrev'] for t in db_manager.get_translations()]
+    
+    engine = ErrorDetectionEngine(db_manager, near_duplicates)
+    total_errors = 0
+    severity_counts = Counter()
+    for translation in translations:
+        result = engine.scan_translation(translation)
+        total_errors += result['errors_found']
+        severity_counts += result['severity_counts']
+        print(f"{translation}: {result['errors_found']} errors in {result['total_verses']} verses")
+    db_manager.optimize()
+    
+    by_severity = ", ".join(f"{count} {severity}" for severity, count in sorted(severity_counts.items()))
+    print(f"Total: {total_errors} errors" + (f" ({by_severity})" if by_severity else ""))
+    
+    if fail_on and any(severity_counts[severity] for severity in FAIL_ON_SEVERITIES[fail_on]):
+        return FINDINGS_EXIT_STATUS
+    return 0
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Bible Text Correction System")
+    parser.add_argument('--db', default='bible_correction.db',
+                        help='Database file path (default: bible_correction.db)')
+    parser.add_argument('--headless', action='store_true',
+                        help='Scan for errors and exit instead of starting the GUI')
+    parser.add_argument('--near-duplicates', action='store_true',
+                        help='With --headless, also report nearly identical verses (needs datasketch)')
+    parser.add_argument('--fail-on', choices=sorted(FAIL_ON_SEVERITIES),
+                        help=f'With --headless, exit with status {FINDINGS_EXIT_STATUS} if any CRITICAL '
+                             '(error) or CRITICAL/WARNING (warning) errors are found')
+    parser.add_argument('translations', nargs='*',
+                        help='Translations to scan with --headless (default: all)')
+    args = parser.parse_args()
+    
+    if args.near_duplicates and not DATASKETCH_AVAILABLE:
+        parser.error("--near-duplicates requires the datasketch package")
+    
     # Setup logging
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     
     # Initialize database
-    db_manager = BibleDatabaseManager()
+    db_manager = BibleDatabaseManager(args.db)
+    
+    if args.headless:
+        try:
+            return run_headless_scan(db_manager, args.translations, args.near_duplicates, args.fail_on)
+        finally:
+            db_manager.close()
     
-    # Import GUI here to avoid circular imports
+    # Import GUI here to avoid circular imports; tkinter itself is only
+    # loaded for the GUI, not by headless runs or import worker processes
+    import tkinter as tk
     from bible_correction_gui import BibleCorrectionGUI
     
     # Create and run GUI
@@ -762,4 +1458,4 @@ def main():
         db_manager.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -15,15 +15,64 @@ import os
 import sqlite3
 import sys
 import logging
+import bisect
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 import unicodedata
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Patterns used by BibleErrorAnalyzer on every verse, compiled once
+_RE_DIGIT = re.compile(r'\d')
+_RE_MARKUP = re.compile(r'<[^>]+>|&[a-zA-Z]+;')
+
+# Characters allowed in verse text: letters, whitespace and punctuation
+# (including curly quotes). Translating with _STRIP_VALID_CHARS leaves only
+# the invalid characters, in one pass instead of a regex match per character.
+_VALID_CHARS = (
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    ".,;:!?'\"()[]/-–—\u201c\u201d\u2018\u2019…"
+    + ''.join(c for c in map(chr, range(0x3001)) if c.isspace())
+)
+_STRIP_VALID_CHARS = str.maketrans('', '', _VALID_CHARS)
+
+# Deletes ASCII, leaving the characters the encoding check has to look up
+_STRIP_ASCII = dict.fromkeys(range(128))
+
+# Whether a non-ASCII character is in a control category (C*), memoised
+# per character: a translation repeats the same few non-ASCII characters,
+# so unicodedata.category runs once for each. Seeded with Latin-1.
+_IS_CONTROL_CHAR = {chr(i): unicodedata.category(chr(i)).startswith('C') for i in range(128, 256)}
+
+# Shared by every error insert, so they all hit one cached prepared statement
+_INSERT_ERROR_SQL = """
+    INSERT INTO error_instances 
+    (translation, book, chapter, verse, line_number, error_type_id, error_text, context)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 @dataclass
 class ErrorInstance:
     """Represents a single error instance"""
+    # Slots instead of a per-instance __dict__; a scan keeps every error in memory
+    __slots__ = ('translation', 'book', 'chapter', 'verse', 'line_number',
+                 'error_code', 'error_text', 'context', 'severity')
     translation: str
     book: str
     chapter: int
@@ -37,9 +86,12 @@ class ErrorInstance:
 class DatabaseManager:
     """Manages SQLite database operations for error storage"""
     
+    MARK_REVIEWED_CHUNK_SIZE = 500  # ids per UPDATE in mark_reviewed
+    
     def __init__(self, db_path: str = "bible_errors.db"):
         self.db_path = db_path
         self.conn = None
+        self.fts_enabled = False
         self.setup_database()
         self.setup_error_types()
     
@@ -47,6 +99,11 @@ class DatabaseManager:
         """Initialize database connection and create tables"""
         self.conn = sqlite3.connect(self.db_path)
         self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")  # Readers don't block the scan; persists in the file
+        self.conn.execute("PRAGMA synchronous = NORMAL")  # WAL stays consistent; skips fsync per commit
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -65536")  # up to 64 MB of page cache
+        self.conn.execute("PRAGMA mmap_size = 268435456")  # read pages through a 256 MB memory map
         
         # Create tables
         self.conn.executescript("""
@@ -79,12 +136,62 @@ class DatabaseManager:
                 FOREIGN KEY (error_type_id) REFERENCES error_types(id)
             );
             
-            CREATE INDEX IF NOT EXISTS idx_error_instances_translation ON error_instances(translation);
+            -- Superseded by idx_error_instances_filter, which starts with translation
+            DROP INDEX IF EXISTS idx_error_instances_translation;
+            CREATE INDEX IF NOT EXISTS idx_error_instances_filter ON error_instances(translation, error_type_id, reviewed);
             CREATE INDEX IF NOT EXISTS idx_error_instances_book ON error_instances(book);
             CREATE INDEX IF NOT EXISTS idx_error_instances_error_type ON error_instances(error_type_id);
             CREATE INDEX IF NOT EXISTS idx_error_instances_reviewed ON error_instances(reviewed);
         """)
         self.conn.commit()
+        
+        self._setup_error_search()
+    
+    def _setup_error_search(self):
+        """Create the trigram full-text index used by get_errors_filtered
+        
+        Error rows are only ever inserted and deleted (reviewing changes no
+        indexed column), so the writers keep the index in step directly.
+        SQLite builds without FTS5 or the trigram tokenizer (3.34+) keep the
+        plain LIKE scan.
+        """
+        existed = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'errors_fts'"
+        ).fetchone() is not None
+        
+        try:
+            self.conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS errors_fts USING fts5(
+                    book, error_text, context,
+                    content='error_instances', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logging.warning(f"Full-text error search unavailable, using LIKE scans: {e}")
+            return
+        
+        if not existed:
+            # Index errors stored before the search table existed
+            self.conn.execute("INSERT INTO errors_fts(errors_fts) VALUES ('rebuild')")
+            self.conn.commit()
+        
+        self.fts_enabled = True
+    
+    def _index_translation_errors(self, translation: str):
+        """Add a translation's errors to the full-text index"""
+        if self.fts_enabled:
+            self.conn.execute("""
+                INSERT INTO errors_fts(rowid, book, error_text, context)
+                SELECT id, book, error_text, context FROM error_instances WHERE translation = ?
+            """, (translation,))
+    
+    def _unindex_translation_errors(self, translation: str):
+        """Remove a translation's errors from the full-text index; call before deleting them"""
+        if self.fts_enabled:
+            self.conn.execute("""
+                INSERT INTO errors_fts(errors_fts, rowid, book, error_text, context)
+                SELECT 'delete', id, book, error_text, context FROM error_instances WHERE translation = ?
+            """, (translation,))
     
     def setup_error_types(self):
         """Initialize predefined error types"""
@@ -113,20 +220,20 @@ class DatabaseManager:
                 (error_code, description, severity)
             )
         self.conn.commit()
+        
+        # error_code -> id, so storing an error needs no lookup query
+        self._error_type_ids = dict(self.conn.execute("SELECT error_code, id FROM error_types"))
     
     def get_error_type_id(self, error_code: str) -> int:
         """Get error type ID from error code"""
-        cursor = self.conn.execute(
-            "SELECT id FROM error_types WHERE error_code = ?", (error_code,)
-        )
-        result = cursor.fetchone()
-        if result:
-            return result[0]
-        else:
+        try:
+            return self._error_type_ids[error_code]
+        except KeyError:
             raise ValueError(f"Unknown error code: {error_code}")
     
     def clear_translation_errors(self, translation: str):
         """Clear all errors for a specific translation before rescanning"""
+        self._unindex_translation_errors(translation)
         self.conn.execute(
             "DELETE FROM error_instances WHERE translation = ?", (translation,)
         )
@@ -137,17 +244,44 @@ class DatabaseManager:
         try:
             error_type_id = self.get_error_type_id(error.error_code)
             
-            self.conn.execute("""
-                INSERT INTO error_instances 
-                (translation, book, chapter, verse, line_number, error_type_id, error_text, context)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor = self.conn.execute(_INSERT_ERROR_SQL, (
                 error.translation, error.book, error.chapter, error.verse,
                 error.line_number, error_type_id, error.error_text, error.context
             ))
+            if self.fts_enabled:
+                self.conn.execute(
+                    "INSERT INTO errors_fts(rowid, book, error_text, context) VALUES (?, ?, ?, ?)",
+                    (cursor.lastrowid, error.book, error.error_text, error.context)
+                )
         except Exception as e:
             logging.error(f"Failed to store error: {e}")
     
+    def _error_rows(self, errors: Iterable[ErrorInstance]) -> Iterator[tuple]:
+        """Yield error_instances rows for errors, skipping unknown error codes"""
+        for error in errors:
+            error_type_id = self._error_type_ids.get(error.error_code)
+            if error_type_id is None:
+                logging.error(f"Failed to store error: Unknown error code: {error.error_code}")
+                continue
+            yield (
+                error.translation, error.book, error.chapter, error.verse,
+                error.line_number, error_type_id, error.error_text, error.context
+            )
+    
+    def replace_translation_errors(self, translation: str, errors: Iterable[ErrorInstance]):
+        """Replace a translation's errors with a new scan's in one transaction
+        
+        Rows are streamed into executemany, so no second copy of the errors
+        is built; errors may be any iterable, including a generator.
+        """
+        with self.conn:
+            self._unindex_translation_errors(translation)
+            self.conn.execute(
+                "DELETE FROM error_instances WHERE translation = ?", (translation,)
+            )
+            self.conn.executemany(_INSERT_ERROR_SQL, self._error_rows(errors))
+            self._index_translation_errors(translation)
+    
     def update_statistics(self):
         """Update error statistics table"""
         # Clear existing statistics
@@ -203,6 +337,14 @@ class DatabaseManager:
             query += " AND (ei.book LIKE ? OR ei.error_text LIKE ? OR ei.context LIKE ?)"
             search_param = f"%{search_text}%"
             params.extend([search_param, search_param, search_param])
+            
+            if self.fts_enabled and len(search_text) >= 3 and not any(c in search_text for c in '%_'):
+                # The trigram index narrows the candidates (one phrase MATCH
+                # covers all three columns; OR-ed LIKEs on it would scan it);
+                # the LIKEs above keep the exact matching rules. LIKE
+                # wildcards have no MATCH equivalent, so those keep the scan.
+                query += " AND ei.id IN (SELECT rowid FROM errors_fts WHERE errors_fts MATCH ?)"
+                params.append('"' + search_text.replace('"', '""') + '"')
         
         if reviewed is not None:
             query += " AND ei.reviewed = ?"
@@ -216,18 +358,66 @@ class DatabaseManager:
     
     def mark_reviewed(self, error_ids: List[int], reviewed: bool = True):
         """Mark errors as reviewed or unreviewed"""
-        placeholders = ",".join("?" * len(error_ids))
-        self.conn.execute(
-            f"UPDATE error_instances SET reviewed = ? WHERE id IN ({placeholders})",
-            [reviewed] + error_ids
-        )
-        self.conn.commit()
+        error_ids = list(error_ids)
+        # Fixed-size chunks stay under SQLite's bound parameter limit (999
+        # before SQLite 3.32), and every full chunk reuses one cached statement
+        with self.conn:
+            for start in range(0, len(error_ids), self.MARK_REVIEWED_CHUNK_SIZE):
+                chunk = error_ids[start:start + self.MARK_REVIEWED_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                self.conn.execute(
+                    f"UPDATE error_instances SET reviewed = ? WHERE id IN ({placeholders})",
+                    [reviewed] + chunk
+                )
     
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
 
+class SourceLineIndex:
+    """Finds the line of a JSON file that a piece of text appears on
+    
+    Lines holding one string value ("1": "In the beginning...") are indexed
+    by the first 50 characters of the value, so looking up a verse is a dict
+    hit rather than a scan of every line. A verse therefore resolves to its
+    own line even when an earlier line quotes its opening mid-value. Other
+    text is located with one str.find over the whole file and cached.
+    """
+    
+    PREFIX_LENGTH = 50
+    
+    def __init__(self, content: str):
+        self.content = content
+        self._line_starts = []  # offset of each line's first character
+        self._line_numbers = {}  # search text -> line number
+        
+        offset = 0
+        for line_number, line in enumerate(content.split('\n'), 1):
+            self._line_starts.append(offset)
+            offset += len(line) + 1
+            
+            value_start = line.find('": "')
+            if value_start != -1:
+                value = line[value_start + 4:].rstrip().rstrip(',')
+                if value.endswith('"'):
+                    self._line_numbers.setdefault(value[:-1][:self.PREFIX_LENGTH], line_number)
+    
+    def find(self, text: str) -> int:
+        """Line number (from 1) of text[:50]; 0 if none
+        
+        This is the first line whose string value starts with text[:50],
+        otherwise the first line containing it anywhere.
+        """
+        search_text = text[:self.PREFIX_LENGTH]
+        line_number = self._line_numbers.get(search_text)
+        if line_number is None:
+            # A line never contains a newline
+            position = self.content.find(search_text) if '\n' not in search_text else -1
+            line_number = bisect.bisect_right(self._line_starts, position) if position != -1 else 0
+            self._line_numbers[search_text] = line_number
+        return line_number
+
 class BibleErrorAnalyzer:
     """Enhanced Bible error analyzer with database integration"""
     
@@ -242,8 +432,8 @@ class BibleErrorAnalyzer:
         '2Pe', '1Jo', '2Jo', '3Jo', 'Jde', 'Rev'
     ]
     
-    def __init__(self, db_manager: DatabaseManager):
-        self.db = db_manager
+    def __init__(self, db_manager: Optional[DatabaseManager]):
+        self.db = db_manager  # None when only analyze_file is used
         self.line_number = 0
         self.errors = []
         
@@ -261,11 +451,11 @@ class BibleErrorAnalyzer:
         translation = json_file.stem.upper()
         
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-                bible_data = json.loads(content)
-        except json.JSONDecodeError as e:
+            raw = json_file.read_bytes()
+            # Decoded separately for the line-number lookups; the parser takes bytes
+            source = SourceLineIndex(raw.decode('utf-8'))
+            bible_data = json_loads(raw)
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book="FILE",
@@ -293,17 +483,17 @@ class BibleErrorAnalyzer:
             return self.errors
         
         # Structure validation
-        self._check_structure(bible_data, translation, lines)
+        self._check_structure(bible_data, translation, source)
         
         # Content validation
         books = bible_data.get('books', {})
         verse_hashes = {}  # For duplicate detection
         
         for book_abbrev, book_data in books.items():
-            self._check_book_structure(book_abbrev, book_data, translation, lines)
+            self._check_book_structure(book_abbrev, book_data, translation, source)
             
             chapters = book_data.get('chapters', {})
-            self._check_chapter_sequence(book_abbrev, chapters, translation, lines)
+            self._check_chapter_sequence(book_abbrev, chapters, translation, source)
             
             for chapter_str, verses in chapters.items():
                 try:
@@ -314,7 +504,7 @@ class BibleErrorAnalyzer:
                         book=book_abbrev,
                         chapter=0,
                         verse=0,
-                        line_number=self._find_line_number(lines, f'"{chapter_str}"'),
+                        line_number=self._find_line_number(source, f'"{chapter_str}"'),
                         error_code="NON_INTEGER_REFERENCE",
                         error_text=f"Non-integer chapter number: '{chapter_str}'",
                         context="",
@@ -322,9 +512,26 @@ class BibleErrorAnalyzer:
                     ))
                     continue
                 
-                self._check_verse_sequence(book_abbrev, chapter_num, verses, translation, lines)
+                self._check_verse_sequence(book_abbrev, chapter_num, verses, translation, source)
                 
                 for verse_str, verse_text in verses.items():
+                    is_text = isinstance(verse_text, str)
+                    
+                    # Empty verses are caught in this pass rather than by a
+                    # second walk over the chapter
+                    if not verse_text or not (verse_text if is_text else str(verse_text)).strip():
+                        self.errors.append(ErrorInstance(
+                            translation=translation,
+                            book=book_abbrev,
+                            chapter=chapter_num,
+                            verse=int(verse_str) if verse_str.isdigit() else 0,
+                            line_number=self._find_line_number(source, f'"{verse_str}"'),
+                            error_code="EMPTY_CONTENT",
+                            error_text="Empty verse content",
+                            context="",
+                            severity="ERROR"
+                        ))
+                    
                     try:
                         verse_num = int(verse_str)
                     except ValueError:
@@ -333,7 +540,7 @@ class BibleErrorAnalyzer:
                             book=book_abbrev,
                             chapter=chapter_num,
                             verse=0,
-                            line_number=self._find_line_number(lines, f'"{verse_str}"'),
+                            line_number=self._find_line_number(source, f'"{verse_str}"'),
                             error_code="NON_INTEGER_REFERENCE",
                             error_text=f"Non-integer verse number: '{verse_str}'",
                             context="",
@@ -341,13 +548,13 @@ class BibleErrorAnalyzer:
                         ))
                         continue
                     
-                    if isinstance(verse_text, str):
-                        line_num = self._find_line_number(lines, verse_text)
+                    if is_text:
+                        line_num = self._find_line_number(source, verse_text)
                         location = f"{book_abbrev}:{chapter_num}:{verse_num}"
                         
                         # Text content analysis
                         self._check_text_content(verse_text, translation, book_abbrev, 
-                                               chapter_num, verse_num, line_num, lines)
+                                               chapter_num, verse_num, line_num, source)
                         
                         # Duplicate detection
                         self._check_duplicates(verse_text, location, verse_hashes, 
@@ -355,18 +562,14 @@ class BibleErrorAnalyzer:
         
         return self.errors
     
-    def _find_line_number(self, lines: List[str], text: str) -> int:
+    def _find_line_number(self, source: SourceLineIndex, text: str) -> int:
         """Find approximate line number for given text"""
         if not text or len(text) < 10:
             return 0
         
-        search_text = text[:50] if len(text) > 50 else text
-        for i, line in enumerate(lines):
-            if search_text in line:
-                return i + 1
-        return 0
+        return source.find(text)
     
-    def _check_structure(self, bible_data: Dict, translation: str, lines: List[str]):
+    def _check_structure(self, bible_data: Dict, translation: str, source: SourceLineIndex):
         """Check overall JSON structure"""
         if 'translation_info' not in bible_data:
             self.errors.append(ErrorInstance(
@@ -385,7 +588,7 @@ class BibleErrorAnalyzer:
             abbrev = trans_info.get('abbrev', '')
             
             if not abbrev or len(abbrev) != 3 or not abbrev.isupper():
-                line_num = self._find_line_number(lines, '"abbrev"')
+                line_num = self._find_line_number(source, '"abbrev"')
                 self.errors.append(ErrorInstance(
                     translation=translation,
                     book="ROOT",
@@ -404,7 +607,7 @@ class BibleErrorAnalyzer:
                 book="ROOT",
                 chapter=0,
                 verse=0,
-                line_number=self._find_line_number(lines, '"books"'),
+                line_number=self._find_line_number(source, '"books"'),
                 error_code="STRUCTURE_VIOLATION",
                 error_text="Missing books section",
                 context="",
@@ -412,10 +615,10 @@ class BibleErrorAnalyzer:
             ))
     
     def _check_book_structure(self, book_abbrev: str, book_data: Dict, 
-                            translation: str, lines: List[str]):
+                            translation: str, source: SourceLineIndex):
         """Check individual book structure"""
         if not isinstance(book_data, dict):
-            line_num = self._find_line_number(lines, f'"{book_abbrev}"')
+            line_num = self._find_line_number(source, f'"{book_abbrev}"')
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book_abbrev,
@@ -430,7 +633,7 @@ class BibleErrorAnalyzer:
             return
         
         if 'chapters' not in book_data:
-            line_num = self._find_line_number(lines, f'"{book_abbrev}"')
+            line_num = self._find_line_number(source, f'"{book_abbrev}"')
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book_abbrev,
@@ -443,7 +646,7 @@ class BibleErrorAnalyzer:
                 severity="ERROR"
             ))
         elif not book_data['chapters']:
-            line_num = self._find_line_number(lines, f'"{book_abbrev}"')
+            line_num = self._find_line_number(source, f'"{book_abbrev}"')
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book_abbrev,
@@ -457,7 +660,7 @@ class BibleErrorAnalyzer:
             ))
     
     def _check_chapter_sequence(self, book_abbrev: str, chapters: Dict, 
-                              translation: str, lines: List[str]):
+                              translation: str, source: SourceLineIndex):
         """Check chapter sequence for gaps and duplicates"""
         chapter_nums = []
         for chapter_str in chapters.keys():
@@ -469,12 +672,13 @@ class BibleErrorAnalyzer:
         if not chapter_nums:
             return
         
+        chapter_counts = Counter(chapter_nums)
+        
         # Check for gaps
-        expected_chapters = list(range(1, max(chapter_nums) + 1))
-        missing_chapters = set(expected_chapters) - set(chapter_nums)
+        missing_chapters = [num for num in range(1, max(chapter_nums) + 1) if num not in chapter_counts]
         
         if missing_chapters:
-            line_num = self._find_line_number(lines, f'"{book_abbrev}"')
+            line_num = self._find_line_number(source, f'"{book_abbrev}"')
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book_abbrev,
@@ -482,15 +686,15 @@ class BibleErrorAnalyzer:
                 verse=0,
                 line_number=line_num,
                 error_code="CHAPTER_SEQUENCE",
-                error_text=f"Missing chapters: {sorted(missing_chapters)}",
+                error_text=f"Missing chapters: {missing_chapters}",
                 context=f"Expected chapters 1-{max(chapter_nums)}",
                 severity="ERROR"
             ))
         
         # Check for duplicates
-        duplicates = [num for num in chapter_nums if chapter_nums.count(num) > 1]
+        duplicates = sorted(num for num, count in chapter_counts.items() if count > 1)
         if duplicates:
-            line_num = self._find_line_number(lines, f'"{book_abbrev}"')
+            line_num = self._find_line_number(source, f'"{book_abbrev}"')
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book_abbrev,
@@ -498,13 +702,13 @@ class BibleErrorAnalyzer:
                 verse=0,
                 line_number=line_num,
                 error_code="CHAPTER_SEQUENCE",
-                error_text=f"Duplicate chapters: {sorted(set(duplicates))}",
+                error_text=f"Duplicate chapters: {duplicates}",
                 context="",
                 severity="ERROR"
             ))
     
     def _check_verse_sequence(self, book_abbrev: str, chapter_num: int, 
-                            verses: Dict, translation: str, lines: List[str]):
+                            verses: Dict, translation: str, source: SourceLineIndex):
         """Check verse sequence within a chapter"""
         verse_nums = []
         for verse_str in verses.keys():
@@ -516,28 +720,13 @@ class BibleErrorAnalyzer:
         if not verse_nums:
             return
         
-        # Check for empty verses
-        for verse_str, verse_text in verses.items():
-            if not verse_text or not str(verse_text).strip():
-                line_num = self._find_line_number(lines, f'"{verse_str}"')
-                self.errors.append(ErrorInstance(
-                    translation=translation,
-                    book=book_abbrev,
-                    chapter=chapter_num,
-                    verse=int(verse_str) if verse_str.isdigit() else 0,
-                    line_number=line_num,
-                    error_code="EMPTY_CONTENT",
-                    error_text="Empty verse content",
-                    context="",
-                    severity="ERROR"
-                ))
+        verse_counts = Counter(verse_nums)
         
         # Check for gaps in verse sequence
-        expected_verses = list(range(1, max(verse_nums) + 1))
-        missing_verses = set(expected_verses) - set(verse_nums)
+        missing_verses = [num for num in range(1, max(verse_nums) + 1) if num not in verse_counts]
         
         if missing_verses:
-            line_num = self._find_line_number(lines, f'"chapters"')
+            line_num = self._find_line_number(source, f'"chapters"')
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book_abbrev,
@@ -545,15 +734,15 @@ class BibleErrorAnalyzer:
                 verse=0,
                 line_number=line_num,
                 error_code="MISSING_VERSES",
-                error_text=f"Missing verses: {sorted(missing_verses)}",
+                error_text=f"Missing verses: {missing_verses}",
                 context=f"Chapter {chapter_num}",
                 severity="ERROR"
             ))
         
         # Check for duplicate verses
-        duplicates = [num for num in verse_nums if verse_nums.count(num) > 1]
+        duplicates = sorted(num for num, count in verse_counts.items() if count > 1)
         if duplicates:
-            line_num = self._find_line_number(lines, f'"chapters"')
+            line_num = self._find_line_number(source, f'"chapters"')
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book_abbrev,
@@ -561,18 +750,26 @@ class BibleErrorAnalyzer:
                 verse=0,
                 line_number=line_num,
                 error_code="DUPLICATE_VERSES",
-                error_text=f"Duplicate verses: {sorted(set(duplicates))}",
+                error_text=f"Duplicate verses: {duplicates}",
                 context=f"Chapter {chapter_num}",
                 severity="ERROR"
             ))
     
     def _check_text_content(self, text: str, translation: str, book: str, 
-                          chapter: int, verse: int, line_num: int, lines: List[str]):
+                          chapter: int, verse: int, line_num: int, source: SourceLineIndex):
         """Check text content for various issues"""
+        if not text:
+            return  # Reported as EMPTY_CONTENT by the caller
+        
         location_context = f"{book} {chapter}:{verse}"
         
+        # One translate pass leaves only the characters outside _VALID_CHARS.
+        # Digits and markup characters are among them, so the digit and
+        # markup regexes only need to run on verses that have any.
+        invalid_chars = text.translate(_STRIP_VALID_CHARS)
+        
         # Check for numbers
-        if re.search(r'\d', text):
+        if invalid_chars and _RE_DIGIT.search(invalid_chars):
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book,
@@ -586,9 +783,8 @@ class BibleErrorAnalyzer:
             ))
         
         # Check for invalid characters
-        if not re.match(r'^[a-zA-Z\s\.,;:!?\'"()\[\]\/\-–—""''…]*$', text):
-            invalid_chars = set(char for char in text 
-                              if not re.match(r'[a-zA-Z\s\.,;:!?\'"()\[\]\/\-–—""''…]', char))
+        if invalid_chars:
+            invalid_chars = set(invalid_chars)
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book,
@@ -602,7 +798,7 @@ class BibleErrorAnalyzer:
             ))
         
         # Check for multiple spaces
-        if re.search(r'  +', text):
+        if '  ' in text:
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book,
@@ -641,8 +837,8 @@ class BibleErrorAnalyzer:
                 severity="WARNING"
             ))
         
-        # Check for HTML/XML remnants
-        if re.search(r'<[^>]+>|&[a-zA-Z]+;', text):
+        # Check for HTML/XML remnants; every match starts with '<' or '&'
+        if ('<' in invalid_chars or '&' in invalid_chars) and _RE_MARKUP.search(text):
             self.errors.append(ErrorInstance(
                 translation=translation,
                 book=book,
@@ -671,10 +867,12 @@ class BibleErrorAnalyzer:
         
         # Check for unusual unicode/encoding
         unusual_chars = []
-        for char in text:
-            if ord(char) > 127:
-                category = unicodedata.category(char)
-                if category.startswith('C'):  # Control characters
+        if not text.isascii():
+            for char in text.translate(_STRIP_ASCII):
+                is_control = _IS_CONTROL_CHAR.get(char)
+                if is_control is None:
+                    is_control = _IS_CONTROL_CHAR[char] = unicodedata.category(char).startswith('C')
+                if is_control:  # Control characters
                     unusual_chars.append(char)
         
         if unusual_chars:
@@ -742,25 +940,30 @@ class BibleErrorAnalyzer:
         
         self.logger.info(f"Scanning {total_files} JSON files...")
         
-        for i, json_file in enumerate(json_files):
-            translation = json_file.stem.upper()
-            self.logger.info(f"[{i+1}/{total_files}] Analyzing {json_file.name}...")
+        # Files are independent, so with several CPUs they are analyzed in
+        # worker processes while this one writes each result to the database.
+        # The workers are spawned rather than forked so they don't inherit
+        # this process's open database connection.
+        workers = min(total_files, os.cpu_count() or 1)
+        spawn = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) if workers > 1 else nullcontext() as pool:
+            if pool:
+                analyses = pool.map(analyze_json_file, json_files)
+            else:
+                analyses = map(self.analyze_file, json_files)
             
-            # Clear existing errors for this translation
-            self.db.clear_translation_errors(translation)
-            
-            # Analyze file
-            errors = self.analyze_file(json_file)
-            
-            # Store errors in database
-            for error in errors:
-                self.db.store_error(error)
-            
-            results[translation] = len(errors)
-            
-            # Call progress callback if provided
-            if progress_callback:
-                progress_callback(i + 1, total_files, translation, len(errors))
+            for i, (json_file, errors) in enumerate(zip(json_files, analyses)):
+                translation = json_file.stem.upper()
+                self.logger.info(f"[{i+1}/{total_files}] Analyzed {json_file.name}")
+                
+                # Swap the old errors for the new ones in a single transaction
+                self.db.replace_translation_errors(translation, errors)
+                
+                results[translation] = len(errors)
+                
+                # Call progress callback if provided
+                if progress_callback:
+                    progress_callback(i + 1, total_files, translation, len(errors))
         
         # Update statistics
         self.db.update_statistics()
@@ -768,6 +971,13 @@ class BibleErrorAnalyzer:
         
         return results
 
+def analyze_json_file(json_file: Path) -> List[ErrorInstance]:
+    """Analyze one JSON Bible file without a database
+    
+    Module-level so scan_directory can run it in worker processes.
+    """
+    return BibleErrorAnalyzer(None).analyze_file(json_file)
+
 def main():
     """Main entry point for command line usage"""
     import argparse
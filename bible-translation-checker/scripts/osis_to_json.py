@@ -7,19 +7,36 @@ Handles the standard 66 books of the Bible with consistent abbreviations.
 
 Requirements:
 - Python 3.6+ (uses built-in xml.etree.ElementTree)
+- pip install orjson (optional, faster JSON output)
 
 Usage:
     python osis_to_json.py
 """
 
 import os
+import sys
 import json
 import re
 import logging
+import multiprocessing
 import xml.etree.ElementTree as ET
-from typing import Dict, Optional, Set
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Dict, Optional, Set, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_dumps_indented(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes, non-ASCII unescaped"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -110,6 +127,19 @@ EXPECTED_BOOKS = [
     'Col', '1Th', '2Th', '1Ti', '2Ti', 'Tit', 'Phm', 'Heb', 'Jas', '1Pe',
     '2Pe', '1Jo', '2Jo', '3Jo', 'Jde', 'Rev'
 ]
+EXPECTED_BOOKS_SET = frozenset(EXPECTED_BOOKS)  # For membership tests
+
+# Element tags as iterparse reports them (namespace in Clark notation)
+OSIS_NAMESPACE = 'http://www.bibletechnologies.net/2003/OSIS/namespace'
+DIV_TAG = f'{{{OSIS_NAMESPACE}}}div'
+CHAPTER_TAG = f'{{{OSIS_NAMESPACE}}}chapter'
+VERSE_TAG = f'{{{OSIS_NAMESPACE}}}verse'
+
+# Chapter or verse number following an osisID prefix
+OSIS_NUMBER = re.compile(r'\d+')
+
+# Runs of whitespace collapsed by clean_text, which runs once per verse
+WHITESPACE_RUN = re.compile(r'\s+')
 
 def extract_translation_info(root) -> Dict[str, str]:
     """Extract translation abbreviation and name from OSIS XML."""
@@ -148,107 +178,123 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     # Remove extra whitespace and newlines
-    cleaned = re.sub(r'\s+', ' ', text.strip())
+    cleaned = WHITESPACE_RUN.sub(' ', text.strip())
     return cleaned
 
+def osis_number(osis_id: str, prefix: str) -> Optional[str]:
+    """Return the number after prefix in an osisID (e.g. "Gen.1.5", "Gen.1." -> "5"), or None."""
+    if not osis_id.startswith(prefix):
+        return None
+    match = OSIS_NUMBER.match(osis_id, len(prefix))
+    # Interned: the same few hundred numbers key every book's chapters and
+    # verses, so the output dict shares one string per number
+    return sys.intern(match.group()) if match else None
+
+def start_book(book_div, books: Dict, books_found: Set[str]) -> Optional[Dict]:
+    """Add an entry for a book div to books; returns its chapters, or None to skip it."""
+    osis_book_id = book_div.get('osisID')
+    if not osis_book_id:
+        return None
+        
+    # Map OSIS book ID to our 3-letter abbreviation
+    book_info = BOOK_MAPPING.get(osis_book_id)
+    if book_info is None:
+        logger.warning(f"Skipping unknown book: {osis_book_id}")
+        return None
+        
+    book_abbrev = book_info['abbrev']
+    book_name = book_info['name']
+    
+    books_found.add(book_abbrev)
+    
+    # Initialize book structure
+    books[book_abbrev] = {
+        "name": book_name,
+        "chapters": {}
+    }
+    return books[book_abbrev]["chapters"]
+
+def extract_chapter(chapter, osis_book_id: str, chapters: Dict):
+    """Add a closed chapter element and its verses to a book's chapters."""
+    chapter_id = chapter.get('osisID')
+    if not chapter_id:
+        return
+        
+    # Extract chapter number from osisID (e.g., "Gen.1" -> "1")
+    chapter_num = osis_number(chapter_id, f'{osis_book_id}.')
+    if chapter_num is None:
+        return
+        
+    chapters[chapter_num] = {}
+    verse_prefix = f'{osis_book_id}.{chapter_num}.'
+    
+    # Find all verses in this chapter
+    for verse in chapter.iter(VERSE_TAG):
+        verse_id = verse.get('osisID')
+        if not verse_id:
+            continue
+            
+        # Extract verse number from osisID (e.g., "Gen.1.1" -> "1")
+        verse_num = osis_number(verse_id, verse_prefix)
+        if verse_num is None:
+            continue
+        
+        # Get verse text and clean it. The verse's own tail is kept: a
+        # milestone verse (<verse sID="..."/>) carries its text there.
+        verse_text = verse.text or ""
+        if verse.tail:
+            verse_text += verse.tail
+        
+        # Also get text from any child elements, each in document order.
+        # Most verses have none, and len() is cheaper than an empty loop.
+        if len(verse):
+            for child in verse:
+                verse_text += "".join(child.itertext())
+                if child.tail:
+                    verse_text += child.tail
+        
+        verse_text = clean_text(verse_text)
+        chapters[chapter_num][verse_num] = verse_text
+
 def convert_osis_to_json(xml_file: Path) -> Optional[Dict]:
     """Convert a single OSIS XML file to JSON format."""
     try:
         logger.info(f"Processing {xml_file.name}...")
         
-        # Parse XML
+        books = {}
+        books_found = set()
+        root = None
+        book_div = None  # Book div being read
+        book_chapters = None  # Its chapters, or None if the book is skipped
+        
+        # Stream the XML: chapters are read as they close and each book is
+        # cleared once read, so only one book's elements are held at a time
         try:
-            tree = ET.parse(str(xml_file))
-            root = tree.getroot()
+            with open(xml_file, 'rb') as f:
+                for event, elem in ET.iterparse(f, events=('start', 'end')):
+                    if event == 'start':
+                        if root is None:
+                            root = elem
+                        if book_div is None and elem.tag == DIV_TAG and elem.get('type') == 'book':
+                            book_div = elem
+                            book_chapters = start_book(elem, books, books_found)
+                    elif elem.tag == CHAPTER_TAG:
+                        if book_chapters is not None:
+                            extract_chapter(elem, book_div.get('osisID'), book_chapters)
+                    elif elem is book_div:
+                        book_div.clear()
+                        book_div = None
+                        book_chapters = None
         except ET.ParseError as e:
             logger.error(f"XML syntax error in {xml_file.name}: {e}")
             return None
         
-        # Extract translation info
-        translation_info = extract_translation_info(root)
-        
-        # Initialize JSON structure
+        # The header is never cleared, so it is still under the root
         bible_json = {
-            "translation_info": translation_info,
-            "books": {}
+            "translation_info": extract_translation_info(root),
+            "books": books
         }
         
-        # Define namespace for cleaner code
-        ns = {'osis': 'http://www.bibletechnologies.net/2003/OSIS/namespace'}
-        
-        # Find all book divs
-        book_divs = root.findall('.//osis:div[@type="book"]', ns)
-        
-        books_found = set()
-        
-        for book_div in book_divs:
-            osis_book_id = book_div.get('osisID')
-            if not osis_book_id:
-                continue
-                
-            # Map OSIS book ID to our 3-letter abbreviation
-            if osis_book_id not in BOOK_MAPPING:
-                logger.warning(f"Skipping unknown book: {osis_book_id}")
-                continue
-                
-            book_info = BOOK_MAPPING[osis_book_id]
-            book_abbrev = book_info['abbrev']
-            book_name = book_info['name']
-            
-            books_found.add(book_abbrev)
-            
-            # Initialize book structure
-            bible_json["books"][book_abbrev] = {
-                "name": book_name,
-                "chapters": {}
-            }
-            
-            # Find all chapters in this book
-            chapters = book_div.findall('.//osis:chapter', ns)
-            
-            for chapter in chapters:
-                chapter_id = chapter.get('osisID')
-                if not chapter_id:
-                    continue
-                    
-                # Extract chapter number from osisID (e.g., "Gen.1" -> "1")
-                chapter_match = re.match(rf'{re.escape(osis_book_id)}\.(\d+)', chapter_id)
-                if not chapter_match:
-                    continue
-                    
-                chapter_num = chapter_match.group(1)
-                bible_json["books"][book_abbrev]["chapters"][chapter_num] = {}
-                
-                # Find all verses in this chapter
-                verses = chapter.findall('.//osis:verse', ns)
-                
-                for verse in verses:
-                    verse_id = verse.get('osisID')
-                    if not verse_id:
-                        continue
-                        
-                    # Extract verse number from osisID (e.g., "Gen.1.1" -> "1")
-                    verse_match = re.match(rf'{re.escape(osis_book_id)}\.{re.escape(chapter_num)}\.(\d+)', verse_id)
-                    if not verse_match:
-                        continue
-                        
-                    verse_num = verse_match.group(1)
-                    
-                    # Get verse text and clean it
-                    verse_text = ""
-                    if verse.text:
-                        verse_text = verse.text
-                    
-                    # Also get text from any child elements
-                    for elem in verse.iter():
-                        if elem.text and elem.tag != verse.tag:
-                            verse_text += elem.text
-                        if elem.tail:
-                            verse_text += elem.tail
-                    
-                    verse_text = clean_text(verse_text)
-                    bible_json["books"][book_abbrev]["chapters"][chapter_num][verse_num] = verse_text
-        
         # Validate that we have some books
         if not books_found:
             logger.error(f"No valid books found in {xml_file.name}")
@@ -292,7 +338,7 @@ def validate_json_structure(bible_json: Dict, filename: str) -> bool:
                 logger.error(f"{filename}: Book abbreviation '{book_abbrev}' is not 3 letters")
                 return False
                 
-            if book_abbrev not in EXPECTED_BOOKS:
+            if book_abbrev not in EXPECTED_BOOKS_SET:
                 logger.warning(f"{filename}: Unexpected book abbreviation '{book_abbrev}'")
         
         logger.info(f"{filename}: Validation passed")
@@ -302,6 +348,27 @@ def validate_json_structure(bible_json: Dict, filename: str) -> bool:
         logger.error(f"{filename}: Validation error: {e}")
         return False
 
+def convert_file(xml_file: Path) -> Optional[Tuple[str, bytes]]:
+    """Convert and validate one XML file; returns its output file name and JSON, or None on failure."""
+    try:
+        # Convert to JSON
+        bible_json = convert_osis_to_json(xml_file)
+        
+        if bible_json is None:
+            return None
+            
+        # Validate structure
+        if not validate_json_structure(bible_json, xml_file.name):
+            return None
+            
+        # Generate output filename
+        trans_abbrev = bible_json["translation_info"]["abbrev"]
+        return f"{trans_abbrev}.json", json_dumps_indented(bible_json)
+        
+    except Exception as e:
+        logger.error(f"Failed to process {xml_file.name}: {e}")
+        return None
+
 def main():
     """Main conversion function."""
     # Set up paths
@@ -318,38 +385,40 @@ def main():
     successful_conversions = 0
     failed_conversions = 0
     
-    for xml_file in xml_files:
-        # Skip Zone.Identifier files
-        if xml_file.name.endswith('.xml:Zone.Identifier'):
-            continue
-            
-        try:
-            # Convert to JSON
-            bible_json = convert_osis_to_json(xml_file)
-            
-            if bible_json is None:
+    # Skip Zone.Identifier files
+    xml_files = [f for f in xml_files if not f.name.endswith('.xml:Zone.Identifier')]
+    
+    # Files are independent, so with several CPUs they are converted in
+    # worker processes. This one writes the results in directory order, so
+    # when two files share a translation abbreviation the same one still wins.
+    # Like the app's other process pools, the workers are spawned rather
+    # than forked, so they start the same way on every platform.
+    workers = min(len(xml_files), os.cpu_count() or 1)
+    spawn = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) if workers > 1 else nullcontext() as pool:
+        if pool:
+            conversions = pool.map(convert_file, xml_files)
+        else:
+            conversions = map(convert_file, xml_files)
+        
+        for xml_file, conversion in zip(xml_files, conversions):
+            if conversion is None:
                 failed_conversions += 1
                 continue
                 
-            # Validate structure
-            if not validate_json_structure(bible_json, xml_file.name):
+            output_name, json_bytes = conversion
+            output_file = xml_dir / output_name
+            
+            try:
+                # Write JSON file
+                output_file.write_bytes(json_bytes)
+            except Exception as e:
+                logger.error(f"Failed to process {xml_file.name}: {e}")
                 failed_conversions += 1
                 continue
                 
-            # Generate output filename
-            trans_abbrev = bible_json["translation_info"]["abbrev"]
-            output_file = xml_dir / f"{trans_abbrev}.json"
-            
-            # Write JSON file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(bible_json, f, ensure_ascii=False, indent=2)
-                
             logger.info(f"Successfully converted {xml_file.name} -> {output_file.name}")
             successful_conversions += 1
-            
-        except Exception as e:
-            logger.error(f"Failed to process {xml_file.name}: {e}")
-            failed_conversions += 1
     
     logger.info(f"Conversion complete: {successful_conversions} successful, {failed_conversions} failed")
 
@@ -0,0 +1,45 @@
+"""
+Shared fixtures for the Bible translation checker tests
+
+The scripts are run directly rather than installed, so their directory is
+put on sys.path here for the test modules to import them.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from bible_correction_system import BibleDatabaseManager
+
+
+def write_bible(path: Path, abbrev: str, books: dict) -> Path:
+    """Write a JSON Bible in the osis_to_json layout
+
+    books maps a book abbreviation to {chapter: {verse: text}}.
+    """
+    path.write_text(json.dumps({
+        "translation_info": {"abbrev": abbrev, "name": f"{abbrev} Test Translation"},
+        "books": {
+            book: {
+                "name": book,
+                "chapters": {
+                    str(chapter): {str(verse): text for verse, text in verses.items()}
+                    for chapter, verses in chapters.items()
+                }
+            }
+            for book, chapters in books.items()
+        }
+    }, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A BibleDatabaseManager on a fresh database file"""
+    manager = BibleDatabaseManager(str(tmp_path / "bible_correction.db"))
+    yield manager
+    manager.close()
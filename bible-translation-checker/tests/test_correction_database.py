@@ -0,0 +1,331 @@
+"""
+Tests for BibleDatabaseManager's stored state and the queries over it
+"""
+
+import sqlite3
+
+import pytest
+
+from bible_correction_system import BibleDatabaseManager, ErrorDetectionEngine, verse_text_hash
+from conftest import write_bible
+
+# Schema created by the first release, before cascading foreign keys,
+# bible_verses.text_hash and the verse search index
+BASELINE_SCHEMA = """
+    CREATE TABLE translations (
+        abbrev TEXT PRIMARY KEY,
+        full_name TEXT,
+        source_file TEXT,
+        imported_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+        total_verses INTEGER DEFAULT 0,
+        error_count INTEGER DEFAULT 0
+    );
+    CREATE TABLE bible_verses (
+        id INTEGER PRIMARY KEY,
+        translation TEXT,
+        book TEXT,
+        book_name TEXT,
+        chapter INTEGER,
+        verse INTEGER,
+        original_text TEXT,
+        corrected_text TEXT,
+        last_modified DATETIME DEFAULT CURRENT_TIMESTAMP,
+        correction_notes TEXT,
+        has_errors BOOLEAN DEFAULT 0,
+        FOREIGN KEY (translation) REFERENCES translations(abbrev),
+        UNIQUE(translation, book, chapter, verse)
+    );
+    CREATE TABLE error_types (
+        id INTEGER PRIMARY KEY,
+        error_code TEXT UNIQUE,
+        description TEXT,
+        severity TEXT,
+        fix_suggestion TEXT
+    );
+    CREATE TABLE error_instances (
+        id INTEGER PRIMARY KEY,
+        verse_id INTEGER,
+        error_type_id INTEGER,
+        status TEXT DEFAULT 'open',
+        error_text TEXT,
+        context TEXT,
+        line_reference TEXT,
+        detected_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+        resolved_date DATETIME,
+        resolution_notes TEXT,
+        FOREIGN KEY (verse_id) REFERENCES bible_verses(id),
+        FOREIGN KEY (error_type_id) REFERENCES error_types(id)
+    );
+    CREATE TABLE error_statistics (
+        error_type_id INTEGER PRIMARY KEY,
+        total_count INTEGER DEFAULT 0,
+        open_count INTEGER DEFAULT 0,
+        fixed_count INTEGER DEFAULT 0,
+        ignored_count INTEGER DEFAULT 0,
+        last_updated DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (error_type_id) REFERENCES error_types(id)
+    );
+    CREATE INDEX idx_bible_verses_translation ON bible_verses(translation);
+    CREATE INDEX idx_bible_verses_book ON bible_verses(book);
+    CREATE INDEX idx_bible_verses_errors ON bible_verses(has_errors);
+    CREATE INDEX idx_error_instances_verse ON error_instances(verse_id);
+    CREATE INDEX idx_error_instances_status ON error_instances(status);
+    CREATE INDEX idx_error_instances_type ON error_instances(error_type_id);
+"""
+
+BASELINE_VERSES = [
+    ("Gen", "Genesis", 1, 1, "In the beginning God created the heaven and the earth."),
+    ("Gen", "Genesis", 1, 2, "And the earth was without form, and void."),
+    ("Joh", "John", 11, 35, "Jesus  wept."),
+]
+
+SAMPLE_BOOKS = {
+    "Gen": {1: {
+        1: "In the beginning God created the heaven and the earth.",
+        2: "And the earth was without form, and void.",
+        3: "And God said, Let there be light: and there was light.",
+    }},
+    "Joh": {11: {
+        35: "Jesus  wept.",
+        36: "Then said the Jews, Behold how he loved him 2 times!",
+    }},
+}
+
+
+def create_baseline_db(path):
+    """Create a database as the first release left it, with one open error"""
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.execute("INSERT INTO translations (abbrev, full_name, total_verses) VALUES ('OLD', 'Old Version', 3)")
+    conn.executemany(
+        "INSERT INTO bible_verses (translation, book, book_name, chapter, verse, original_text) "
+        "VALUES ('OLD', ?, ?, ?, ?, ?)",
+        BASELINE_VERSES
+    )
+    conn.execute(
+        "INSERT INTO error_types (error_code, description, severity) "
+        "VALUES ('MULTIPLE_SPACES', 'Multiple consecutive spaces', 'WARNING')"
+    )
+    conn.execute(
+        "INSERT INTO error_instances (verse_id, error_type_id, error_text) VALUES (3, 1, 'Double space')"
+    )
+    conn.execute("UPDATE bible_verses SET has_errors = 1 WHERE id = 3")
+    conn.commit()
+    conn.close()
+
+
+def on_delete_actions(conn, table):
+    """Map each parent table of table's foreign keys to its ON DELETE action"""
+    return {fk[2]: fk[6] for fk in conn.execute(f"PRAGMA foreign_key_list({table})")}
+
+
+def assert_search_index_consistent(db):
+    """Check the verse search index against bible_verses"""
+    if not db.fts_enabled:
+        pytest.skip("SQLite build without FTS5 trigram support")
+    # rank = 1 also compares the index with the external content table
+    with db.conn:
+        db.conn.execute("INSERT INTO verses_fts(verses_fts, rank) VALUES ('integrity-check', 1)")
+
+
+def search_refs(db, text, **kwargs):
+    """References of the verses search_verses finds for text"""
+    return [f"{row['translation']} {row['book']} {row['chapter']}:{row['verse']}"
+            for row in db.search_verses(text, **kwargs)]
+
+
+def test_baseline_database_is_migrated(tmp_path):
+    path = tmp_path / "baseline.db"
+    create_baseline_db(path)
+
+    db = BibleDatabaseManager(str(path))
+    try:
+        conn = db.conn
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+
+        # Foreign keys now cascade; rows survived the table rebuild
+        assert on_delete_actions(conn, "bible_verses")["translations"] == "CASCADE"
+        assert on_delete_actions(conn, "error_instances")["bible_verses"] == "CASCADE"
+        assert on_delete_actions(conn, "error_instances")["error_types"] != "CASCADE"
+        assert conn.execute("SELECT COUNT(*) FROM bible_verses").fetchone()[0] == 3
+        assert conn.execute("SELECT verse_id, error_text FROM error_instances").fetchall() == [(3, "Double space")]
+
+        # Indexes dropped with the old tables are recreated
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"idx_error_instances_verse", "idx_error_instances_filter",
+                "idx_bible_verses_hash"} <= indexes
+        assert "idx_error_instances_status" not in indexes
+
+        # Existing verses get their text hash and are searchable
+        for text, text_hash in conn.execute("SELECT original_text, text_hash FROM bible_verses"):
+            assert text_hash == verse_text_hash(text)
+        assert search_refs(db, "without form") == ["OLD Gen 1:2"]
+        assert_search_index_consistent(db)
+    finally:
+        db.close()
+
+    # Opening the migrated database again changes nothing
+    db = BibleDatabaseManager(str(path))
+    try:
+        assert db.conn.execute("SELECT COUNT(*) FROM error_instances").fetchone()[0] == 1
+        assert search_refs(db, "without form") == ["OLD Gen 1:2"]
+        assert_search_index_consistent(db)
+    finally:
+        db.close()
+
+
+def test_migrated_database_reimports_translation(tmp_path):
+    path = tmp_path / "baseline.db"
+    create_baseline_db(path)
+
+    db = BibleDatabaseManager(str(path))
+    try:
+        result = db.import_json_file(write_bible(tmp_path / "old.json", "OLD", SAMPLE_BOOKS))
+        assert result["total_verses"] == 5
+
+        # Replacing the verses cascaded to the error on the old ones
+        assert db.conn.execute("SELECT COUNT(*) FROM error_instances").fetchone()[0] == 0
+        assert db.conn.execute("PRAGMA foreign_key_check").fetchall() == []
+        assert search_refs(db, "let there be light") == ["OLD Gen 1:3"]
+        assert_search_index_consistent(db)
+    finally:
+        db.close()
+
+
+def test_search_index_follows_import_edit_and_delete(db, tmp_path):
+    db.import_json_file(write_bible(tmp_path / "aaa.json", "AAA", SAMPLE_BOOKS))
+    db.import_json_file(write_bible(tmp_path / "bbb.json", "BBB", {"Gen": {1: {1: "In the beginning was the Word."}}}))
+    assert search_refs(db, "in the beginning") == ["AAA Gen 1:1", "BBB Gen 1:1"]
+    assert search_refs(db, "in the beginning", translation="BBB") == ["BBB Gen 1:1"]
+    assert_search_index_consistent(db)
+
+    # A corrected text is searchable; the original stays searchable too
+    verse_id = db.search_verses("without form")[0]["id"]
+    assert db.update_verse(verse_id, "And the earth was formless and empty.")
+    assert search_refs(db, "formless", search_corrected=True) == ["AAA Gen 1:2"]
+    assert search_refs(db, "without form") == ["AAA Gen 1:2"]
+    assert_search_index_consistent(db)
+
+    # Bulk corrections go through the same trigger
+    assert db.collapse_multiple_spaces() == 1
+    assert search_refs(db, "Jesus wept", search_corrected=True) == ["AAA Joh 11:35"]
+    assert_search_index_consistent(db)
+
+    # Re-importing replaces the indexed text
+    db.import_json_file(write_bible(tmp_path / "bbb2.json", "BBB", {"Gen": {1: {1: "At first there was the Word."}}}))
+    assert search_refs(db, "in the beginning") == ["AAA Gen 1:1"]
+    assert search_refs(db, "at first") == ["BBB Gen 1:1"]
+    assert_search_index_consistent(db)
+
+    db.delete_translation("AAA")
+    assert search_refs(db, "in the beginning") == []
+    assert search_refs(db, "formless", search_corrected=True) == []
+    assert search_refs(db, "at first") == ["BBB Gen 1:1"]
+    assert_search_index_consistent(db)
+
+
+def test_delete_translation_cascades_to_errors(db, tmp_path):
+    db.import_json_file(write_bible(tmp_path / "aaa.json", "AAA", SAMPLE_BOOKS))
+    db.import_json_file(write_bible(tmp_path / "bbb.json", "BBB", SAMPLE_BOOKS))
+    engine = ErrorDetectionEngine(db)
+    assert engine.scan_translation("AAA")["errors_found"] > 0
+    bbb_errors = engine.scan_translation("BBB")["errors_found"]
+
+    db.delete_translation("AAA")
+
+    conn = db.conn
+    assert conn.execute("SELECT COUNT(*) FROM bible_verses WHERE translation = 'AAA'").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM translations WHERE abbrev = 'AAA'").fetchone()[0] == 0
+    # Only BBB's errors are left, and none points at a deleted verse
+    assert len(db.get_error_instances()) == bbb_errors
+    assert {row["translation"] for row in db.get_error_instances()} == {"BBB"}
+    assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+    assert sum(stat["total_count"] for stat in db.get_error_statistics()) == bbb_errors
+
+
+def test_rescan_replaces_errors(db, tmp_path):
+    db.import_json_file(write_bible(tmp_path / "aaa.json", "AAA", SAMPLE_BOOKS))
+    engine = ErrorDetectionEngine(db)
+    found = engine.scan_translation("AAA")["errors_found"]
+
+    # A second scan swaps the errors rather than adding to them
+    assert engine.scan_translation("AAA")["errors_found"] == found
+    codes = sorted(row["error_code"] for row in db.get_error_instances())
+    assert codes == ["INVALID_CHARS", "MULTIPLE_SPACES", "NUMBERS_IN_TEXT"]
+    flagged = {row[0] for row in db.conn.execute(
+        "SELECT verse FROM bible_verses WHERE translation = 'AAA' AND has_errors"
+    )}
+    assert flagged == {35, 36}
+
+    # Fixing the text and rescanning clears the errors and the flags
+    db.import_json_file(write_bible(tmp_path / "aaa2.json", "AAA", {"Gen": {1: {1: "In the beginning."}}}))
+    assert engine.scan_translation("AAA")["errors_found"] == 0
+    assert db.get_error_instances() == []
+    assert db.conn.execute("SELECT COUNT(*) FROM bible_verses WHERE has_errors").fetchone()[0] == 0
+
+
+def test_bulk_status_update_and_statistics(db, tmp_path):
+    db.import_json_file(write_bible(tmp_path / "aaa.json", "AAA", SAMPLE_BOOKS))
+    ErrorDetectionEngine(db).scan_translation("AAA")
+
+    assert db.bulk_set_error_status("ignored", error_code="MULTIPLE_SPACES", resolution_notes="style") == 1
+    assert [row["error_code"] for row in db.get_error_instances(status="ignored")] == ["MULTIPLE_SPACES"]
+    assert len(db.get_error_instances(status="open")) == 2
+
+    stats = {stat["error_code"]: stat for stat in db.get_error_statistics()}
+    assert stats["MULTIPLE_SPACES"]["ignored_count"] == 1
+    assert stats["MULTIPLE_SPACES"]["open_count"] == 0
+    assert db.get_translations()[0]["error_count"] == 2
+
+    assert db.bulk_set_error_status("open", from_status="ignored") == 1
+    assert len(db.get_error_instances(status="open")) == 3
+
+
+def test_error_pages_by_cursor_match_full_listing(db, tmp_path):
+    books = {"Gen": {1: {verse: f"Verse  {verse} text" for verse in range(1, 40)}}}
+    db.import_json_file(write_bible(tmp_path / "aaa.json", "AAA", books))
+    ErrorDetectionEngine(db).scan_translation("AAA")
+
+    everything = [row["id"] for row in db.get_error_instances()]
+    paged, cursor = [], None
+    while True:
+        page = db.get_error_instances(limit=7, before=cursor)
+        paged += [row["id"] for row in page]
+        if len(page) < 7:
+            break
+        cursor = (page[-1]["detected_date"], page[-1]["id"])
+
+    assert len(everything) > 7
+    assert paged == everything
+
+
+def test_dashboard_snapshot_is_one_read(db, tmp_path, monkeypatch):
+    db.import_json_file(write_bible(tmp_path / "aaa.json", "AAA", SAMPLE_BOOKS))
+    engine = ErrorDetectionEngine(db)
+    found = engine.scan_translation("AAA")["errors_found"]
+
+    # Another connection clears the errors between the snapshot's reads
+    get_error_statistics = db.get_error_statistics
+
+    def statistics_then_clear():
+        stats = get_error_statistics()
+        other = BibleDatabaseManager(db.db_path)
+        try:
+            other.replace_translation_errors("AAA", [])
+            other.update_error_statistics()
+        finally:
+            other.close()
+        return stats
+
+    monkeypatch.setattr(db, "get_error_statistics", statistics_then_clear)
+    snapshot = db.get_dashboard_snapshot()
+
+    assert snapshot["translations"][0]["error_count"] == found
+    assert sum(stat["total_count"] for stat in snapshot["error_stats"]) == found
+    assert len(snapshot["recent_errors"]) == found
+    assert not db.conn.in_transaction
+
+    # The next snapshot sees the cleared errors
+    monkeypatch.undo()
+    assert db.get_dashboard_snapshot()["recent_errors"] == []
@@ -0,0 +1,140 @@
+"""
+Tests for bible_error_analyzer's source line lookups and the
+translate-based invalid-character check
+"""
+
+import ast
+import re
+import sys
+
+import pytest
+
+import bible_correction_system
+import bible_error_analyzer
+from bible_error_analyzer import BibleErrorAnalyzer, SourceLineIndex
+from conftest import write_bible
+
+# The per-character class the check used before it switched to str.translate.
+# Its quotes were meant to be curly but are plain ASCII.
+OLD_VALID_CHAR = re.compile(r'[a-zA-Z\s\.,;:!?\'"()\[\]\/\-–—""…]')
+
+CURLY_QUOTES = {"“", "”", "‘", "’"}
+
+SOURCE = """{
+  "translation_info": {
+    "abbrev": "TST",
+    "description": "Opens with: In the beginning God created the heaven and the earth, and all the host of them."
+  },
+  "books": {
+    "Gen": {
+      "chapters": {
+        "1": {
+          "1": "In the beginning God created the heaven and the earth, and all the host of them.",
+          "2": "And the earth was without form, and void.",
+          "3": "And the earth was without form, and void."
+        }
+      }
+    }
+  },
+  "notes": ["See also: the earth was without form", "last"]
+}"""
+
+
+def scan_lines(content, text):
+    """Line of the first line containing text[:50], found by scanning every line"""
+    search_text = text[:SourceLineIndex.PREFIX_LENGTH]
+    for line_number, line in enumerate(content.split("\n"), 1):
+        if search_text in line:
+            return line_number
+    return 0
+
+
+def expected_line(content, text):
+    """Line find should give: the first line whose value starts with text[:50],
+    otherwise the first line containing it"""
+    search_text = text[:SourceLineIndex.PREFIX_LENGTH]
+    for line_number, line in enumerate(content.split("\n"), 1):
+        if '": "' + search_text in line:
+            return line_number
+    return scan_lines(content, text)
+
+
+@pytest.mark.parametrize("text, line_number", [
+    # Indexed by the first 50 characters of the value
+    ("In the beginning God created the heaven and the earth, and all the host of them.", 10),
+    ("In the beginning God created the heaven and the earth, but longer", 10),
+    # Repeated values resolve to the first line holding them
+    ("And the earth was without form, and void.", 11),
+    # Text that is not the start of a value is found with a search of the file
+    ("See also: the earth", 17),
+    ("translation_info", 2),
+    ("God created the heaven", 4),
+    ("Not in the file at all", 0),
+    ("two\nlines", 0),
+])
+def test_source_line_index_find(text, line_number):
+    index = SourceLineIndex(SOURCE)
+    assert index.find(text) == line_number
+    # Cached lookups give the same answer
+    assert index.find(text) == line_number
+
+
+def test_source_line_index_prefers_the_line_a_value_starts_on():
+    verse = "In the beginning God created the heaven and the earth, and all the host of them."
+    # The description quotes the verse's first 50 characters mid-line, on an
+    # earlier line than the verse itself
+    assert scan_lines(SOURCE, verse) == 4
+    assert SourceLineIndex(SOURCE).find(verse) == 10
+
+
+def test_source_line_index_follows_lookup_rule_for_every_line():
+    index = SourceLineIndex(SOURCE)
+    for line in SOURCE.split("\n"):
+        for start in range(0, len(line), 7):
+            text = line[start:]
+            if text:
+                assert index.find(text) == expected_line(SOURCE, text), text
+
+
+def test_source_line_index_handles_crlf_files():
+    content = SOURCE.replace("\n", "\r\n")
+    index = SourceLineIndex(content)
+    assert index.find("And the earth was without form, and void.") == 11
+    assert index.find("See also: the earth") == 17
+
+
+@pytest.mark.parametrize("module", [bible_error_analyzer, bible_correction_system])
+def test_translate_table_matches_old_character_class(module):
+    characters = [chr(code) for code in range(sys.maxunicode + 1)]
+    invalid = {char for char in characters if char.translate(module._STRIP_VALID_CHARS)}
+    old_invalid = {char for char in characters if not OLD_VALID_CHAR.match(char)}
+
+    # Curly quotes were the one deliberate addition to the allowed set
+    assert invalid == old_invalid - CURLY_QUOTES
+
+
+def invalid_chars_by_verse(errors):
+    """Map verse number to the characters its INVALID_CHARS error lists"""
+    return {
+        error.verse: set(ast.literal_eval(error.error_text.split(": ", 1)[1]))
+        for error in errors if error.error_code == "INVALID_CHARS"
+    }
+
+
+def test_analyzer_reports_invalid_characters(tmp_path):
+    path = write_bible(tmp_path / "tst.json", "TST", {"Gen": {1: {
+        1: "In the beginning God created the heaven and the earth.",
+        2: "“Let there be light” — and there was ‘light’…",
+        3: "Tabs\tand no-break\u00a0spaces are whitespace.",
+        4: "Day 3: <b>light</b> & dark",
+        5: "Café naïve ¿qué?",
+    }}})
+
+    errors = BibleErrorAnalyzer(None).analyze_file(path)
+
+    assert invalid_chars_by_verse(errors) == {
+        4: {"3", "<", ">", "&"},
+        5: {"é", "ï", "¿"},
+    }
+    numbers = {error.verse for error in errors if error.error_code == "NUMBERS_IN_TEXT"}
+    assert numbers == {4}